@@ -5,12 +5,59 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://AnswerDotAI.github.io',
                 'git_url': 'https://github.com/AnswerDotAI/toolslm',
                 'lib_path': 'toolslm'},
-  'syms': { 'toolslm.download': { 'toolslm.download._tryget': ('download.html#_tryget', 'toolslm/download.py'),
+  'syms': { 'toolslm.bench': { 'toolslm.bench._QuietHandler': ('bench.html#_quiethandler', 'toolslm/bench.py'),
+                               'toolslm.bench._QuietHandler.log_message': ('bench.html#_quiethandler.log_message', 'toolslm/bench.py'),
+                               'toolslm.bench._folder_bytes': ('bench.html#_folder_bytes', 'toolslm/bench.py'),
+                               'toolslm.bench._pysrc': ('bench.html#_pysrc', 'toolslm/bench.py'),
+                               'toolslm.bench._resolve_fn': ('bench.html#_resolve_fn', 'toolslm/bench.py'),
+                               'toolslm.bench._text': ('bench.html#_text', 'toolslm/bench.py'),
+                               'toolslm.bench.bench': ('bench.html#bench', 'toolslm/bench.py'),
+                               'toolslm.bench.bench_fn': ('bench.html#bench_fn', 'toolslm/bench.py'),
+                               'toolslm.bench.compare': ('bench.html#compare', 'toolslm/bench.py'),
+                               'toolslm.bench.fmt_results': ('bench.html#fmt_results', 'toolslm/bench.py'),
+                               'toolslm.bench.mk_nb': ('bench.html#mk_nb', 'toolslm/bench.py'),
+                               'toolslm.bench.mk_site': ('bench.html#mk_site', 'toolslm/bench.py'),
+                               'toolslm.bench.mk_tree': ('bench.html#mk_tree', 'toolslm/bench.py'),
+                               'toolslm.bench.run_benchmarks': ('bench.html#run_benchmarks', 'toolslm/bench.py'),
+                               'toolslm.bench.serve_folder': ('bench.html#serve_folder', 'toolslm/bench.py')},
+            'toolslm.download': { 'toolslm.download.HttpCache': ('download.html#httpcache', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache.__init__': ('download.html#httpcache.__init__', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache.__repr__': ('download.html#httpcache.__repr__', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache._add': ('download.html#httpcache._add', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache.clear': ('download.html#httpcache.clear', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache.get': ('download.html#httpcache.get', 'toolslm/download.py'),
+                                  'toolslm.download.HttpCache.set': ('download.html#httpcache.set', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter': ('download.html#_mdwriter', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.__init__': ('download.html#_mdwriter.__init__', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter._elem': ('download.html#_mdwriter._elem', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.brk': ('download.html#_mdwriter.brk', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.emit': ('download.html#_mdwriter.emit', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.md': ('download.html#_mdwriter.md', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.text': ('download.html#_mdwriter.text', 'toolslm/download.py'),
+                                  'toolslm.download._MdWriter.walk': ('download.html#_mdwriter.walk', 'toolslm/download.py'),
+                                  'toolslm.download._aclient': ('download.html#_aclient', 'toolslm/download.py'),
+                                  'toolslm.download._atryget': ('download.html#_atryget', 'toolslm/download.py'),
+                                  'toolslm.download._cget': ('download.html#_cget', 'toolslm/download.py'),
+                                  'toolslm.download._docs_levels': ('download.html#_docs_levels', 'toolslm/download.py'),
+                                  'toolslm.download._freshness': ('download.html#_freshness', 'toolslm/download.py'),
+                                  'toolslm.download._html2md': ('download.html#_html2md', 'toolslm/download.py'),
+                                  'toolslm.download._llms_doc': ('download.html#_llms_doc', 'toolslm/download.py'),
+                                  'toolslm.download._memo': ('download.html#_memo', 'toolslm/download.py'),
+                                  'toolslm.download._read_capped': ('download.html#_read_capped', 'toolslm/download.py'),
+                                  'toolslm.download._resp': ('download.html#_resp', 'toolslm/download.py'),
+                                  'toolslm.download._tags': ('download.html#_tags', 'toolslm/download.py'),
+                                  'toolslm.download._timed': ('download.html#_timed', 'toolslm/download.py'),
+                                  'toolslm.download._tryget': ('download.html#_tryget', 'toolslm/download.py'),
+                                  'toolslm.download.afind_docs': ('download.html#afind_docs', 'toolslm/download.py'),
+                                  'toolslm.download.aread_docs': ('download.html#aread_docs', 'toolslm/download.py'),
                                   'toolslm.download.clean_md': ('download.html#clean_md', 'toolslm/download.py'),
                                   'toolslm.download.find_docs': ('download.html#find_docs', 'toolslm/download.py'),
                                   'toolslm.download.get_llmstxt': ('download.html#get_llmstxt', 'toolslm/download.py'),
+                                  'toolslm.download.get_llmstxt_iter': ('download.html#get_llmstxt_iter', 'toolslm/download.py'),
                                   'toolslm.download.html2md': ('download.html#html2md', 'toolslm/download.py'),
+                                  'toolslm.download.lxml2md': ('download.html#lxml2md', 'toolslm/download.py'),
                                   'toolslm.download.read_docs': ('download.html#read_docs', 'toolslm/download.py'),
+                                  'toolslm.download.read_docs_many': ('download.html#read_docs_many', 'toolslm/download.py'),
                                   'toolslm.download.read_html': ('download.html#read_html', 'toolslm/download.py'),
                                   'toolslm.download.read_md': ('download.html#read_md', 'toolslm/download.py'),
                                   'toolslm.download.split_url': ('download.html#split_url', 'toolslm/download.py')},
@@ -18,10 +65,35 @@ d = { 'settings': { 'branch': 'main',
                                                                                'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.SymbolNotFound.__repr__': ( 'inspecttools.html#symbolnotfound.__repr__',
                                                                                         'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._abs_mod': ('inspecttools.html#_abs_mod', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._ast_index': ('inspecttools.html#_ast_index', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._bounded_repr': ('inspecttools.html#_bounded_repr', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._container': ('inspecttools.html#_container', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._def_start': ('inspecttools.html#_def_start', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._defs': ('inspecttools.html#_defs', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._file_syms': ('inspecttools.html#_file_syms', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._find_def': ('inspecttools.html#_find_def', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools._find_frame_dict': ( 'inspecttools.html#_find_frame_dict',
                                                                                  'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._modname': ('inspecttools.html#_modname', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._page': ('inspecttools.html#_page', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._parse_sym': ('inspecttools.html#_parse_sym', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._pkg_root': ('inspecttools.html#_pkg_root', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._py_files': ('inspecttools.html#_py_files', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._repr_chunks': ('inspecttools.html#_repr_chunks', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._resolve': ('inspecttools.html#_resolve', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._size_info': ('inspecttools.html#_size_info', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._spec_file': ('inspecttools.html#_spec_file', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools._src_from_lines': ( 'inspecttools.html#_src_from_lines',
                                                                                 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._static_lookup': ( 'inspecttools.html#_static_lookup',
+                                                                               'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._static_spec': ('inspecttools.html#_static_spec', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._static_src': ('inspecttools.html#_static_src', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._sym_index': ('inspecttools.html#_sym_index', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._sync_defs': ('inspecttools.html#_sync_defs', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._target_names': ('inspecttools.html#_target_names', 'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools._walk_stmts': ('inspecttools.html#_walk_stmts', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.importmodule': ('inspecttools.html#importmodule', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.resolve': ('inspecttools.html#resolve', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symdir': ('inspecttools.html#symdir', 'toolslm/inspecttools.py'),
@@ -29,6 +101,7 @@ d = { 'settings': { 'branch': 'main',
                                                                                 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symfiles_package': ( 'inspecttools.html#symfiles_package',
                                                                                  'toolslm/inspecttools.py'),
+                                      'toolslm.inspecttools.symfind': ('inspecttools.html#symfind', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symlen': ('inspecttools.html#symlen', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symnth': ('inspecttools.html#symnth', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symsearch': ('inspecttools.html#symsearch', 'toolslm/inspecttools.py'),
@@ -38,19 +111,126 @@ d = { 'settings': { 'branch': 'main',
                                       'toolslm.inspecttools.symtype': ('inspecttools.html#symtype', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symtype_val': ('inspecttools.html#symtype_val', 'toolslm/inspecttools.py'),
                                       'toolslm.inspecttools.symval': ('inspecttools.html#symval', 'toolslm/inspecttools.py')},
-            'toolslm.minipy': { 'toolslm.minipy._copy_loc': ('minipy.html#_copy_loc', 'toolslm/minipy.py'),
+            'toolslm.minipy': { 'toolslm.minipy.CPUTimeoutError': ('minipy.html#cputimeouterror', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool': ('minipy.html#minipypool', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.__enter__': ('minipy.html#minipypool.__enter__', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.__exit__': ('minipy.html#minipypool.__exit__', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.__init__': ('minipy.html#minipypool.__init__', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.__repr__': ('minipy.html#minipypool.__repr__', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool._acquire': ('minipy.html#minipypool._acquire', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool._restart': ('minipy.html#minipypool._restart', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool._shard': ('minipy.html#minipypool._shard', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool._spawn': ('minipy.html#minipypool._spawn', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.close': ('minipy.html#minipypool.close', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.map': ('minipy.html#minipypool.map', 'toolslm/minipy.py'),
+                                'toolslm.minipy.MiniPyPool.run': ('minipy.html#minipypool.run', 'toolslm/minipy.py'),
+                                'toolslm.minipy._CtxStream': ('minipy.html#_ctxstream', 'toolslm/minipy.py'),
+                                'toolslm.minipy._CtxStream.__getattr__': ('minipy.html#_ctxstream.__getattr__', 'toolslm/minipy.py'),
+                                'toolslm.minipy._CtxStream.__init__': ('minipy.html#_ctxstream.__init__', 'toolslm/minipy.py'),
+                                'toolslm.minipy._CtxStream.flush': ('minipy.html#_ctxstream.flush', 'toolslm/minipy.py'),
+                                'toolslm.minipy._CtxStream.write': ('minipy.html#_ctxstream.write', 'toolslm/minipy.py'),
+                                'toolslm.minipy._Output': ('minipy.html#_output', 'toolslm/minipy.py'),
+                                'toolslm.minipy._Output.__init__': ('minipy.html#_output.__init__', 'toolslm/minipy.py'),
+                                'toolslm.minipy._Output.flush': ('minipy.html#_output.flush', 'toolslm/minipy.py'),
+                                'toolslm.minipy._Output.getvalue': ('minipy.html#_output.getvalue', 'toolslm/minipy.py'),
+                                'toolslm.minipy._Output.write': ('minipy.html#_output.write', 'toolslm/minipy.py'),
+                                'toolslm.minipy._arun': ('minipy.html#_arun', 'toolslm/minipy.py'),
+                                'toolslm.minipy._compile': ('minipy.html#_compile', 'toolslm/minipy.py'),
+                                'toolslm.minipy._copy_loc': ('minipy.html#_copy_loc', 'toolslm/minipy.py'),
+                                'toolslm.minipy._cpu_limit': ('minipy.html#_cpu_limit', 'toolslm/minipy.py'),
+                                'toolslm.minipy._measure': ('minipy.html#_measure', 'toolslm/minipy.py'),
+                                'toolslm.minipy._mem_limit': ('minipy.html#_mem_limit', 'toolslm/minipy.py'),
+                                'toolslm.minipy._output': ('minipy.html#_output', 'toolslm/minipy.py'),
+                                'toolslm.minipy._peak_rss': ('minipy.html#_peak_rss', 'toolslm/minipy.py'),
+                                'toolslm.minipy._raise_in': ('minipy.html#_raise_in', 'toolslm/minipy.py'),
                                 'toolslm.minipy._run': ('minipy.html#_run', 'toolslm/minipy.py'),
+                                'toolslm.minipy._set_mem_rlimit': ('minipy.html#_set_mem_rlimit', 'toolslm/minipy.py'),
+                                'toolslm.minipy._time_limit': ('minipy.html#_time_limit', 'toolslm/minipy.py'),
+                                'toolslm.minipy._vm_size': ('minipy.html#_vm_size', 'toolslm/minipy.py'),
+                                'toolslm.minipy._worker': ('minipy.html#_worker', 'toolslm/minipy.py'),
+                                'toolslm.minipy.aminipy': ('minipy.html#aminipy', 'toolslm/minipy.py'),
+                                'toolslm.minipy.capture_output': ('minipy.html#capture_output', 'toolslm/minipy.py'),
+                                'toolslm.minipy.compile_cache_info': ('minipy.html#compile_cache_info', 'toolslm/minipy.py'),
                                 'toolslm.minipy.minipy': ('minipy.html#minipy', 'toolslm/minipy.py')},
-            'toolslm.shell': { 'toolslm.shell.TerminalInteractiveShell.run_cell': ( 'shell.html#terminalinteractiveshell.run_cell',
+            'toolslm.shell': { 'toolslm.shell.MiniShell': ('shell.html#minishell', 'toolslm/shell.py'),
+                               'toolslm.shell.MiniShell.arun_cell': ('shell.html#minishell.arun_cell', 'toolslm/shell.py'),
+                               'toolslm.shell.MiniShell.run_cell': ('shell.html#minishell.run_cell', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool': ('shell.html#shellpool', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.__init__': ('shell.html#shellpool.__init__', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.__len__': ('shell.html#shellpool.__len__', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.__repr__': ('shell.html#shellpool.__repr__', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.acquire': ('shell.html#shellpool.acquire', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.release': ('shell.html#shellpool.release', 'toolslm/shell.py'),
+                               'toolslm.shell.ShellPool.shell': ('shell.html#shellpool.shell', 'toolslm/shell.py'),
+                               'toolslm.shell.TerminalInteractiveShell.arun_cell': ( 'shell.html#terminalinteractiveshell.arun_cell',
+                                                                                     'toolslm/shell.py'),
+                               'toolslm.shell.TerminalInteractiveShell.run_cell': ( 'shell.html#terminalinteractiveshell.run_cell',
                                                                                     'toolslm/shell.py'),
-                               'toolslm.shell.get_shell': ('shell.html#get_shell', 'toolslm/shell.py')},
-            'toolslm.xml': { 'toolslm.xml._add_nls': ('xml.html#_add_nls', 'toolslm/xml.py'),
+                               'toolslm.shell._TimedCompiler': ('shell.html#_timedcompiler', 'toolslm/shell.py'),
+                               'toolslm.shell._TimedCompiler.__call__': ('shell.html#_timedcompiler.__call__', 'toolslm/shell.py'),
+                               'toolslm.shell._TimedCompiler.ast_parse': ('shell.html#_timedcompiler.ast_parse', 'toolslm/shell.py'),
+                               'toolslm.shell._timeout_result': ('shell.html#_timeout_result', 'toolslm/shell.py'),
+                               'toolslm.shell.get_shell': ('shell.html#get_shell', 'toolslm/shell.py'),
+                               'toolslm.shell.reset_shell': ('shell.html#reset_shell', 'toolslm/shell.py')},
+            'toolslm.xml': { 'toolslm.xml.FileCache': ('xml.html#filecache', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.__call__': ('xml.html#filecache.__call__', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.__init__': ('xml.html#filecache.__init__', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.__repr__': ('xml.html#filecache.__repr__', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache._add': ('xml.html#filecache._add', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache._evict_disk': ('xml.html#filecache._evict_disk', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache._fn': ('xml.html#filecache._fn', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.clear': ('xml.html#filecache.clear', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.get': ('xml.html#filecache.get', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.key': ('xml.html#filecache.key', 'toolslm/xml.py'),
+                             'toolslm.xml.FileCache.set': ('xml.html#filecache.set', 'toolslm/xml.py'),
+                             'toolslm.xml.FolderSnapshot': ('xml.html#foldersnapshot', 'toolslm/xml.py'),
+                             'toolslm.xml.FolderSnapshot.__init__': ('xml.html#foldersnapshot.__init__', 'toolslm/xml.py'),
+                             'toolslm.xml.FolderSnapshot.__repr__': ('xml.html#foldersnapshot.__repr__', 'toolslm/xml.py'),
+                             'toolslm.xml.FolderSnapshot._src': ('xml.html#foldersnapshot._src', 'toolslm/xml.py'),
+                             'toolslm.xml.FolderSnapshot.update': ('xml.html#foldersnapshot.update', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache': ('xml.html#repocache', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.__init__': ('xml.html#repocache.__init__', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.__repr__': ('xml.html#repocache.__repr__', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache._evict': ('xml.html#repocache._evict', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache._fn': ('xml.html#repocache._fn', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache._key': ('xml.html#repocache._key', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache._refs': ('xml.html#repocache._refs', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.clear': ('xml.html#repocache.clear', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.files': ('xml.html#repocache.files', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.get': ('xml.html#repocache.get', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.get_ref': ('xml.html#repocache.get_ref', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.nbytes': ('xml.html#repocache.nbytes', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.path': ('xml.html#repocache.path', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.set': ('xml.html#repocache.set', 'toolslm/xml.py'),
+                             'toolslm.xml.RepoCache.set_ref': ('xml.html#repocache.set_ref', 'toolslm/xml.py'),
+                             'toolslm.xml._MemFile': ('xml.html#_memfile', 'toolslm/xml.py'),
+                             'toolslm.xml._MemFile.stat': ('xml.html#_memfile.stat', 'toolslm/xml.py'),
+                             'toolslm.xml._add_nls': ('xml.html#_add_nls', 'toolslm/xml.py'),
+                             'toolslm.xml._blank_payloads': ('xml.html#_blank_payloads', 'toolslm/xml.py'),
+                             'toolslm.xml._cell_xml': ('xml.html#_cell_xml', 'toolslm/xml.py'),
+                             'toolslm.xml._extract2ctx': ('xml.html#_extract2ctx', 'toolslm/xml.py'),
+                             'toolslm.xml._nbtxt2xml': ('xml.html#_nbtxt2xml', 'toolslm/xml.py'),
+                             'toolslm.xml._out_xml': ('xml.html#_out_xml', 'toolslm/xml.py'),
+                             'toolslm.xml._pack_iter': ('xml.html#_pack_iter', 'toolslm/xml.py'),
+                             'toolslm.xml._path_filter': ('xml.html#_path_filter', 'toolslm/xml.py'),
+                             'toolslm.xml._read_ahead': ('xml.html#_read_ahead', 'toolslm/xml.py'),
+                             'toolslm.xml._read_files': ('xml.html#_read_files', 'toolslm/xml.py'),
+                             'toolslm.xml._read_mem': ('xml.html#_read_mem', 'toolslm/xml.py'),
+                             'toolslm.xml._render_file': ('xml.html#_render_file', 'toolslm/xml.py'),
+                             'toolslm.xml._repo_tarball': ('xml.html#_repo_tarball', 'toolslm/xml.py'),
+                             'toolslm.xml._sort_fnames': ('xml.html#_sort_fnames', 'toolslm/xml.py'),
+                             'toolslm.xml._tar_files': ('xml.html#_tar_files', 'toolslm/xml.py'),
+                             'toolslm.xml._trunc_iter': ('xml.html#_trunc_iter', 'toolslm/xml.py'),
+                             'toolslm.xml._xtag': ('xml.html#_xtag', 'toolslm/xml.py'),
+                             'toolslm.xml.approx_tokens': ('xml.html#approx_tokens', 'toolslm/xml.py'),
                              'toolslm.xml.cell2out': ('xml.html#cell2out', 'toolslm/xml.py'),
                              'toolslm.xml.cell2xml': ('xml.html#cell2xml', 'toolslm/xml.py'),
                              'toolslm.xml.cells2xml': ('xml.html#cells2xml', 'toolslm/xml.py'),
                              'toolslm.xml.docs_xml': ('xml.html#docs_xml', 'toolslm/xml.py'),
+                             'toolslm.xml.docs_xml_iter': ('xml.html#docs_xml_iter', 'toolslm/xml.py'),
                              'toolslm.xml.files2ctx': ('xml.html#files2ctx', 'toolslm/xml.py'),
                              'toolslm.xml.folder2ctx': ('xml.html#folder2ctx', 'toolslm/xml.py'),
+                             'toolslm.xml.folder2ctx_iter': ('xml.html#folder2ctx_iter', 'toolslm/xml.py'),
                              'toolslm.xml.get_mime_text': ('xml.html#get_mime_text', 'toolslm/xml.py'),
                              'toolslm.xml.json_to_xml': ('xml.html#json_to_xml', 'toolslm/xml.py'),
                              'toolslm.xml.mk_doc': ('xml.html#mk_doc', 'toolslm/xml.py'),
@@ -62,4 +242,6 @@ d = { 'settings': { 'branch': 'main',
                              'toolslm.xml.sym2file': ('xml.html#sym2file', 'toolslm/xml.py'),
                              'toolslm.xml.sym2folderctx': ('xml.html#sym2folderctx', 'toolslm/xml.py'),
                              'toolslm.xml.sym2pkgctx': ('xml.html#sym2pkgctx', 'toolslm/xml.py'),
-                             'toolslm.xml.sym2pkgpath': ('xml.html#sym2pkgpath', 'toolslm/xml.py')}}}
+                             'toolslm.xml.sym2pkgpath': ('xml.html#sym2pkgpath', 'toolslm/xml.py'),
+                             'toolslm.xml.tar2ctx': ('xml.html#tar2ctx', 'toolslm/xml.py'),
+                             'toolslm.xml.tar2ctx_iter': ('xml.html#tar2ctx_iter', 'toolslm/xml.py')}}}
@@ -0,0 +1,229 @@
+"""Offline benchmarks for the hot paths in toolslm, with regression checks against a saved baseline
+
+Docs: https://AnswerDotAI.github.io/toolslm/bench.html.md"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_bench.ipynb.
+
+# %% auto #0
+__all__ = ['mk_tree', 'mk_nb', 'serve_folder', 'mk_site', 'bench_fn', 'run_benchmarks', 'compare', 'fmt_results', 'bench']
+
+# %% ../nbs/06_bench.ipynb #e9d85b46
+import json, time, timeit, tracemalloc, tempfile, threading, base64, random
+from contextlib import contextmanager
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from fastcore.utils import *
+from fastcore.script import call_parse
+
+from .xml import folder2ctx, nb2xml, docs_xml, json_to_xml, FileCache
+import toolslm.xml as tx
+from .minipy import minipy
+from .inspecttools import resolve
+from .download import find_docs, read_html
+import toolslm.download as td
+
+# %% ../nbs/06_bench.ipynb #b15c8d4a
+_words = 'the quick brown fox jumps over lazy dog data model token context file folder'.split()
+
+def _text(n, seed=0):
+    "Deterministic filler text of about `n` chars"
+    rng = random.Random(seed)
+    lines,sz = [],0
+    while sz<n:
+        lines.append(' '.join(rng.choices(_words, k=12)))
+        sz += len(lines[-1])+1
+    return '\n'.join(lines)
+
+def _pysrc(n, seed=0):
+    "Deterministic python source of about `n` chars"
+    fs,sz,i = [],0,0
+    while sz<n:
+        fs.append(f'def f{seed}_{i}(a, b=1):\n    "{_text(40, seed+i)}"\n    x = a + b\n    return x * {i}\n')
+        sz += len(fs[-1])
+        i += 1
+    return '\n'.join(fs)
+
+# %% ../nbs/06_bench.ipynb #3c9ab63b
+def mk_tree(
+    path:Path, # Folder to create the tree in
+    n_files:int=200, # Number of files
+    size:int=2_000, # Approximate size of each file in chars
+    depth:int=3, # Nesting depth of subfolders
+    exts:tuple=('py','md','txt') # File extensions to cycle through
+)->Path:
+    "Create a synthetic folder tree of `n_files` text files under `path`"
+    path = Path(path)
+    for i in range(n_files):
+        d = path.joinpath(*[f'd{(i//(j+2))%3}' for j in range(i%(depth+1))])
+        d.mkdir(parents=True, exist_ok=True)
+        ext = exts[i%len(exts)]
+        (d/f'f{i}.{ext}').write_text(_pysrc(size, i) if ext=='py' else _text(size, i))
+    return path
+
+# %% ../nbs/06_bench.ipynb #69677b8f
+def mk_nb(
+    fname:Path, # Notebook file to write
+    n_cells:int=100, # Number of code cells
+    img_size:int=50_000, # Bytes of (random) image data in each cell's output
+    src_size:int=500 # Approximate size of each cell's source in chars
+)->Path:
+    "Write a synthetic notebook with `n_cells` code cells, each with stream, text and image outputs"
+    img = base64.b64encode(random.Random(0).randbytes(img_size)).decode()
+    def out(i):
+        res = [dict(output_type='stream', name='stdout', text=[_text(100, i)])]
+        res.append(dict(output_type='execute_result', execution_count=i, metadata={}, data={'text/plain': [f'<Figure {i}>']}))
+        if img_size: res.append(dict(output_type='display_data', metadata={}, data={'image/png': img, 'text/plain': ['<Figure>']}))
+        return res
+    cells = [dict(cell_type='code', id=f'{i:08x}', execution_count=i, metadata={}, source=_pysrc(src_size, i), outputs=out(i))
+             for i in range(n_cells)]
+    Path(fname).write_text(json.dumps(dict(cells=cells, metadata={}, nbformat=4, nbformat_minor=5), indent=1))
+    return Path(fname)
+
+# %% ../nbs/06_bench.ipynb #250f2c59
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args): pass
+
+@contextmanager
+def serve_folder(path:Path):
+    "Serve `path` over HTTP on a free local port in a background thread, yielding the base URL"
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), partial(_QuietHandler, directory=str(path)))
+    th = threading.Thread(target=srv.serve_forever, daemon=True)
+    th.start()
+    try: yield f'http://127.0.0.1:{srv.server_address[1]}'
+    finally:
+        srv.shutdown()
+        srv.server_close()
+
+# %% ../nbs/06_bench.ipynb #ec27244e
+def mk_site(path:Path, n_sections:int=200)->Path:
+    "Create a small docs site under `path`: a markdown index, and a large HTML reference page nested a few levels down"
+    path = Path(path)
+    (path/'lib').mkdir(parents=True, exist_ok=True)
+    (path/'lib'/'index.md').write_text('# lib\n\n'+_text(2_000))
+    secs = ''.join(f'<section class="api"><h2>f{i}</h2><!-- note --><p>{_text(300, i)}</p><details>x</details><pre><code>f{i}(a, b=1)</code></pre>'
+                   f'<ul><li><code>a</code>: <em>first</em> arg, see <a href="#f{i+1}">f{i+1}</a></li><li><code>b</code>: <strong>second</strong></li></ul>'
+                   f'<table><tr><th>arg</th><th>default</th></tr><tr><td>b</td><td>1</td></tr></table></section>'
+                   for i in range(n_sections))
+    pg = path/'lib'/'api'/'ref'
+    pg.mkdir(parents=True, exist_ok=True)
+    (pg/'page.html').write_text(f'<html><body><nav>menu</nav><main>{secs}</main></body></html>')
+    return path
+
+# %% ../nbs/06_bench.ipynb #a36357d3
+def bench_fn(
+    f:callable, # Function to benchmark, called with no arguments
+    nbytes:int=None, # Size of the input processed per call, used to report MB/s
+    repeat:int=3, # Number of timing runs; the fastest is reported
+    min_time:float=0.2 # Minimum seconds per timing run
+)->dict:
+    "Time `f` and measure the peak memory it allocates"
+    tm = timeit.Timer(f)
+    number = 1
+    while min_time and tm.timeit(number)<min_time: number *= 2
+    secs = min(tm.repeat(repeat, number))/number
+    tracemalloc.start()
+    try:
+        f()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally: tracemalloc.stop()
+    res = dict(secs=secs, per_sec=1/secs if secs else float('inf'), peak_mb=peak/1e6)
+    if nbytes: res['mb_per_sec'] = nbytes/1e6/secs if secs else float('inf')
+    return res
+
+# %% ../nbs/06_bench.ipynb #c5a00e8e
+def _folder_bytes(path): return sum(o.stat().st_size for o in pglob(path))
+
+def _resolve_fn(path):
+    "A no-argument function that resolves `path` in a namespace with the `__dialog_name` sentinel"
+    ns = {'__dialog_name': 'bench', 'resolve': resolve, 'obj': dict2obj(dict(a=dict(b=dict(c=[1,2,3]))))}
+    return eval(f'lambda: resolve({path!r})', ns)
+
+# %% ../nbs/06_bench.ipynb #68883364
+def run_benchmarks(
+    scale:float=1.0, # Multiplier for the size of the synthetic inputs
+    min_time:float=0.2, # Minimum seconds per timing run (0 runs each benchmark once)
+    only:str=None # Only run benchmarks whose name matches this regex
+)->dict:
+    "Run all benchmarks on synthetic data, returning `{name: result}`"
+    res,sz = {},lambda n: max(1, int(n*scale))
+    with tempfile.TemporaryDirectory() as d:
+        d = Path(d)
+        tree = mk_tree(d/'tree', n_files=sz(300), size=2_000)
+        nbfn = mk_nb(d/'heavy.ipynb', n_cells=sz(50), img_size=100_000)
+        site = mk_site(d/'site', n_sections=sz(200))
+        docs = [_text(2_000, i) for i in range(sz(300))]
+        jd = {'items': [dict(name=f'n{i}', vals=list(range(10)), sub=dict(a=i, b=str(i))) for i in range(sz(500))]}
+        def nocache(f):
+            "Run `f` with the `read_file` and HTTP caches disabled, so reading, fetching and rendering is measured"
+            def _f():
+                saved,tx.read_cache,td.http_cache = (tx.read_cache,td.http_cache),None,None
+                try: return f()
+                finally: tx.read_cache,td.http_cache = saved
+            return _f
+        benches = {
+            'folder2ctx': (nocache(partial(folder2ctx, tree, max_total=None)), _folder_bytes(tree)),
+            'folder2ctx_serial': (nocache(partial(folder2ctx, tree, max_total=None, n_workers=0)), _folder_bytes(tree)),
+            'folder2ctx_cached': (partial(folder2ctx, tree, max_total=None), _folder_bytes(tree)),
+            'folder2ctx_sigs': (nocache(partial(folder2ctx, tree, max_total=None, sigs_only=True, file_glob='*.py')), None),
+            'nb2xml': (partial(nb2xml, nbfn), nbfn.stat().st_size),
+            'docs_xml': (partial(docs_xml, docs), sum(map(len, docs))),
+            'json_to_xml': (partial(json_to_xml, jd, 'root'), len(json.dumps(jd))),
+            'minipy': (partial(minipy, 'x = [i*i for i in range(100)]\nsum(x)', {}), None),
+            'resolve': (_resolve_fn('obj.a.b.c[1]'), None),
+        }
+        with serve_folder(site) as url:
+            pg = url+'/lib/api/ref/page.html'
+            pgsz = (site/'lib/api/ref/page.html').stat().st_size
+            benches['find_docs'] = (nocache(partial(find_docs, pg)), None)
+            for fast in (False, True):
+                sfx = '_fast' if fast else ''
+                benches['read_html'+sfx] = (nocache(partial(read_html, pg, fast=fast)), pgsz)
+                benches['read_html_sel'+sfx] = (nocache(partial(read_html, pg, sel='.api', multi=True, fast=fast)), pgsz)
+            for k,(f,n) in benches.items():
+                if only and not re.search(only, k): continue
+                res[k] = bench_fn(f, nbytes=n, min_time=min_time)
+    return res
+
+# %% ../nbs/06_bench.ipynb #41901cc5
+def compare(
+    res:dict, # Results from `run_benchmarks`
+    baseline:dict, # Earlier results to compare against
+    threshold:float=0.2, # Flag increases larger than this fraction
+    keys:tuple=('secs','peak_mb') # Metrics to compare (higher is worse)
+)->list:
+    "List of `(name, metric, baseline, new)` for each metric in `res` that's worse than `baseline` by more than `threshold`"
+    regs = []
+    for name,r in res.items():
+        b = baseline.get(name)
+        if not b: continue
+        for k in keys:
+            if k in r and b.get(k) and r[k] > b[k]*(1+threshold): regs.append((name, k, b[k], r[k]))
+    return regs
+
+# %% ../nbs/06_bench.ipynb #26892efd
+def fmt_results(res:dict, regs:list=None)->str:
+    "Format benchmark results (and any regressions) as a text table"
+    regd = {(n,k) for n,k,*_ in (regs or [])}
+    lines = [f"{'benchmark':<20}{'ms/call':>12}{'calls/s':>12}{'MB/s':>10}{'peak MB':>10}"]
+    for k,r in res.items():
+        mbs = f"{r['mb_per_sec']:.1f}" if 'mb_per_sec' in r else '-'
+        flag = '  REGRESSION: '+','.join(m for n,m in regd if n==k) if any(n==k for n,_ in regd) else ''
+        lines.append(f"{k:<20}{r['secs']*1e3:>12.3f}{r['per_sec']:>12.1f}{mbs:>10}{r['peak_mb']:>10.2f}{flag}")
+    return '\n'.join(lines)
+
+# %% ../nbs/06_bench.ipynb #977611e8
+@call_parse
+def bench(
+    out:str=None, # Save results as JSON to this file
+    baseline:str=None, # JSON results file to compare against
+    threshold:float=0.2, # Flag regressions larger than this fraction
+    scale:float=1.0, # Multiplier for the size of the synthetic inputs
+    min_time:float=0.2, # Minimum seconds per timing run (0 runs each benchmark once)
+    only:str=None # Only run benchmarks whose name matches this regex
+):
+    "Run the toolslm benchmarks, print a table, optionally save results and compare with a baseline; exits with status 1 on regressions"
+    res = run_benchmarks(scale=scale, min_time=min_time, only=only)
+    regs = compare(res, json.loads(Path(baseline).read_text()), threshold=threshold) if baseline else []
+    print(fmt_results(res, regs))
+    if out: Path(out).write_text(json.dumps(res, indent=2))
+    if regs: sys.exit(1)
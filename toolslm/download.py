@@ -3,11 +3,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_download.ipynb.
 
 # %% auto #0
-__all__ = ['clean_md', 'read_md', 'html2md', 'read_html', 'get_llmstxt', 'split_url', 'find_docs', 'read_docs']
+__all__ = ['http_cache', 'DocsResult', 'clean_md', 'HttpCache', 'read_md', 'html2md', 'lxml2md', 'read_html', 'get_llmstxt',
+           'get_llmstxt_iter', 'split_url', 'find_docs', 'read_docs', 'afind_docs', 'aread_docs', 'read_docs_many']
 
 # %% ../nbs/03_download.ipynb #e58d8c43
+import asyncio, hashlib, json, sqlite3, time
+from collections import OrderedDict, namedtuple
+from threading import Lock, BoundedSemaphore, Event
+from email.utils import parsedate_to_datetime
+from contextlib import asynccontextmanager
 from fastcore.utils import *
-from httpx import get
+from fastcore.xml import to_xml, ft, Project, Doc
+from httpx import get, stream, AsyncClient, Response, Request
 from fastcore.meta import delegates
 from urllib.parse import urlparse, urljoin
 from .xml import parse_gh_url
@@ -19,11 +26,125 @@ def clean_md(text, rm_comments=True, rm_details=True):
     if rm_details: text = re.sub(r'\n?<details>.*?</details>\n?', '', text, flags=re.DOTALL)
     return text
 
+# %% ../nbs/03_download.ipynb #e7d1528f
+class HttpCache:
+    "LRU cache of HTTP responses and values derived from them; optionally persisted in a SQLite database at `path`"
+    def __init__(self,
+                 max_bytes:int=50_000_000, # Evict least recently used entries once this size is exceeded (in memory and on disk)
+                 path:Union[str,Path]=None): # SQLite file to also store entries in, so they persist across sessions
+        self.max_bytes,self.d,self.nbytes,self.lock = max_bytes,OrderedDict(),0,Lock()
+        self.hits,self.revalidated,self.misses = 0,0,0
+        self.db = None
+        if path:
+            self.db = sqlite3.connect(str(Path(path).expanduser()), check_same_thread=False)
+            self.db.execute('create table if not exists cache (key text primary key, val text, sz integer, atime real)')
+            self.db.commit()
+
+    def __repr__(self):
+        return f'{type(self).__name__}(hits={self.hits}, revalidated={self.revalidated}, misses={self.misses}, n={len(self.d)}, nbytes={self.nbytes})'
+
+    def get(self, k):
+        "Cached entry (a `dict`) for key `k`, or `None`"
+        with self.lock:
+            if k in self.d:
+                self.d.move_to_end(k)
+                return self.d[k][0]
+            if not self.db: return None
+            row = self.db.execute('select val from cache where key=?', (k,)).fetchone()
+            if not row: return None
+            self.db.execute('update cache set atime=? where key=?', (time.time(), k))
+            self.db.commit()
+        res = json.loads(row[0])
+        self._add(k, res, len(row[0]))
+        return res
+
+    def _add(self, k, v, sz):
+        with self.lock:
+            if k in self.d: self.nbytes -= self.d.pop(k)[1]
+            self.d[k] = (v,sz)
+            self.nbytes += sz
+            while self.nbytes>self.max_bytes and self.d: self.nbytes -= self.d.popitem(last=False)[1][1]
+
+    def set(self, k, v):
+        "Store entry `v` (a JSON-serialisable `dict`) under key `k`"
+        s = json.dumps(v)
+        self._add(k, v, len(s))
+        if not self.db: return
+        with self.lock:
+            self.db.execute('insert or replace into cache values (?,?,?,?)', (k, s, len(s), time.time()))
+            tot = self.db.execute('select sum(sz) from cache').fetchone()[0]
+            for key,sz in self.db.execute('select key,sz from cache order by atime').fetchall():
+                if tot<=self.max_bytes: break
+                self.db.execute('delete from cache where key=?', (key,))
+                tot -= sz
+            self.db.commit()
+
+    def clear(self):
+        "Remove all entries"
+        with self.lock:
+            self.d.clear()
+            self.nbytes = 0
+            if self.db:
+                self.db.execute('delete from cache')
+                self.db.commit()
+
+http_cache = HttpCache()
+
+# %% ../nbs/03_download.ipynb #054037dd
+def _freshness(headers):
+    "Seconds `headers` allow a response to be reused without revalidation, or `None` if it mustn't be stored"
+    cc = {k.strip().lower():v.strip('" ') for k,_,v in (o.partition('=') for o in headers.get('cache-control', '').split(','))}
+    if 'no-store' in cc: return None
+    if 'no-cache' in cc: return 0
+    try:
+        if 'max-age' in cc: return max(int(cc['max-age']), 0)
+        if exp := headers.get('expires'):
+            date = headers.get('date')
+            now = parsedate_to_datetime(date).timestamp() if date else time.time()
+            return max(parsedate_to_datetime(exp).timestamp()-now, 0)
+    except (ValueError, TypeError): return 0
+    return 0
+
+# %% ../nbs/03_download.ipynb #b1e76b33
+def _resp(url, e): return Response(e['status'], text=e['text'], request=Request('GET', url))
+
+def _cget(url, **kwargs):
+    "`get(url, **kwargs)`, going through `http_cache` unless it's `None` or `kwargs` are passed"
+    c = http_cache
+    if c is None or kwargs: return get(url, **kwargs)
+    e,now = c.get(url),time.time()
+    if e and e['expires']>now:
+        c.hits += 1
+        return _resp(url, e)
+    hdrs = {}
+    if e and e['etag']: hdrs['If-None-Match'] = e['etag']
+    if e and e['last_modified']: hdrs['If-Modified-Since'] = e['last_modified']
+    res = get(url, headers=hdrs)
+    fresh = _freshness(res.headers)
+    if e and res.status_code==304:
+        c.revalidated += 1
+        c.set(url, {**e, 'expires': now+(fresh or 0)})
+        return _resp(url, e)
+    c.misses += 1
+    etag,lm = res.headers.get('etag'),res.headers.get('last-modified')
+    if res.status_code in (200,404) and fresh is not None and (fresh or etag or lm):
+        c.set(url, dict(status=res.status_code, text=res.text, etag=etag, last_modified=lm, expires=now+fresh))
+    return res
+
+def _memo(f, text, *args, **kwargs):
+    "`f(text, *args, **kwargs)`, cached in `http_cache` on a hash of `text` and the other arguments"
+    if http_cache is None: return f(text, *args, **kwargs)
+    k = 'memo:' + hashlib.md5(repr((f.__name__, hashlib.md5(text.encode()).hexdigest(), args, kwargs)).encode()).hexdigest()
+    if e := http_cache.get(k): return e['text']
+    res = f(text, *args, **kwargs)
+    http_cache.set(k, dict(text=res))
+    return res
+
 # %% ../nbs/03_download.ipynb #0f3d5c69
 @delegates(get)
 def read_md(url, rm_comments=True, rm_details=True, **kwargs):
     "Read text from `url` and clean with `clean_docs`"
-    return clean_md(get(url, **kwargs).text, rm_comments=rm_comments, rm_details=rm_details)
+    return _memo(clean_md, _cget(url, **kwargs).text, rm_comments=rm_comments, rm_details=rm_details)
 
 # %% ../nbs/03_download.ipynb #d8d61937
 def html2md(s:str, ignore_links=True):
@@ -35,18 +156,160 @@ def html2md(s:str, ignore_links=True):
     o.ignore_images = True
     return o.handle(s)
 
+# %% ../nbs/03_download.ipynb #77960f69
+_ws_re = re.compile(r'[ \t\n\r\f\v]+')
+_md_esc = [(re.compile(r'\\(?=[\\`*_{}\[\]()#+\-.!])'), r'\\\\'), (re.compile(r'^(\s*\d+)(\.)(?=\s)', re.M), r'\1\\\2'),
+           (re.compile(r'^(\s*)(\+)(?=\s)', re.M), r'\1\\\2'), (re.compile(r'^(\s*)(-)(?=\s|-)', re.M), r'\1\\\2')]
+_skip_tags = {'head','script','style','title','img','template'}
+_block_tags = set('p div section main article nav header footer aside figure figcaption form fieldset address center body html dl dt dd'.split())
+_mark_tags = {'b':'**', 'strong':'**', 'i':'_', 'em':'_'}
+_code_tags = {'code','tt','kbd','samp'}
+
+class _MdWriter:
+    "Write markdown for an lxml tree in one walk, following the conventions of `html2text`"
+    def __init__(self, ignore_links=True, rm_details=True):
+        self.ignore_links,self.rm_details = ignore_links,rm_details
+        self.out,self.lists,self.nl,self.cap,self.quote,self.lastq = [],[],0,2,0,0
+        self.sp,self.glue,self.stressed = False,False,False
+
+    def brk(self, n):
+        "Request at least `n` newlines before the next output"
+        if not self.glue: self.nl = max(self.nl, n)
+
+    def emit(self, s):
+        "Write `s`, preceded by any pending newlines (with blockquote prefixes) or space"
+        if self.nl and self.out:
+            nl,pre = min(self.nl, self.cap),'> '*self.quote
+            self.out.append(('\n'+'>'*min(self.quote, self.lastq))*(nl-1) + '\n' + pre)
+        elif self.sp and self.out: self.out.append(' ')
+        self.nl,self.cap,self.lastq,self.sp,self.glue,self.stressed = 0,2,self.quote,False,False,False
+        self.out.append(s)
+
+    def text(self, t):
+        "Write text content `t`, collapsing whitespace and escaping markdown"
+        if not t: return
+        t = _ws_re.sub(' ', t).replace('\xa0', ' ')
+        if t[0]==' ':
+            t = t[1:]
+            if not self.glue: self.sp = True
+        elif self.stressed and t[0] not in '][(){}.!?': self.sp = True
+        self.stressed = False
+        end = t.endswith(' ')
+        if end: t = t[:-1]
+        if t:
+            if '\\' in t or t[0] in '0123456789+-':
+                for r,s in _md_esc: t = r.sub(s, t)
+            self.emit(t)
+        if end: self.sp = True
+
+    def walk(self, el, tail=True):
+        "Write `el` and its children, and then its tail text if `tail`"
+        tag = el.tag.lower() if isinstance(el.tag, str) else None
+        if tag and tag not in _skip_tags and not (tag=='details' and self.rm_details): self._elem(el, tag)
+        if tail: self.text(el.tail)
+
+    def _elem(self, el, tag):
+        close = None
+        if tag in _block_tags: self.brk(2)
+        if tag in ('h1','h2','h3','h4','h5','h6'):
+            self.brk(2)
+            self.emit('#'*int(tag[1])+' ')
+        elif tag in ('ul','ol'):
+            self.brk(1 if self.lists else 2)
+            self.lists.append([tag, 0])
+        elif tag=='li':
+            self.brk(1)
+            lst = self.lists[-1] if self.lists else ['ul', 0]
+            lst[1] += 1
+            self.emit('  '*len(self.lists) + ('* ' if lst[0]=='ul' else f'{lst[1]}. '))
+            self.glue = True
+        elif tag=='pre':
+            self.brk(2)
+            self.emit('[code]\n\n' + '\n'.join('    '+o for o in ''.join(el.itertext()).split('\n')) + '\n[/code]')
+            return self.brk(2)
+        elif tag in _code_tags: return self.emit('`' + _ws_re.sub(' ', ''.join(el.itertext())) + '`')
+        elif tag in _mark_tags:
+            close = _mark_tags[tag]
+            if close=='_' and self.out and not (self.sp or self.nl) and self.out[-1][-1:].isalnum(): self.sp = True
+            self.emit(close)
+            self.glue = True
+        elif tag=='a':
+            href,title = el.get('href'),el.get('title')
+            if not self.ignore_links and href and not href.startswith('#'):
+                if not title and ''.join(el.itertext())==href: return self.emit(f'<{href}>')
+                self.emit('[')
+                self.glue = True
+                close = f']({href} "{title}")' if title else f']({href})'
+        elif tag=='br':
+            self.sp = False
+            self.emit('  ')
+            self.brk(1)
+        elif tag=='hr':
+            self.brk(2)
+            self.emit('* * *')
+            self.brk(2)
+        elif tag=='blockquote':
+            self.brk(2)
+            self.quote += 1
+        elif tag=='table':
+            self.brk(2)
+            self.rows = 0
+        elif tag=='tr':
+            self.brk(1)
+            self.cells = 0
+            self.rows += 1
+        elif tag in ('td','th'):
+            if self.cells: self.out.append('| ')
+            self.cells += 1
+        elif tag=='dd': self.emit('    ')
+
+        self.text(el.text)
+        for o in el: self.walk(o)
+
+        if close:
+            self.out.append(close)
+            self.stressed,self.glue = close in ('**','_'),False
+        if tag in _block_tags or tag in ('h1','h2','h3','h4','h5','h6'): self.brk(2)
+        elif tag in ('ul','ol'):
+            self.lists.pop()
+            self.brk(1 if self.lists else 2)
+        elif tag=='blockquote':
+            self.brk(2)
+            self.quote -= 1
+        elif tag=='tr':
+            self.out.append('  ')
+            if self.rows==1: self.out.append('\n' + '|'.join(['---']*self.cells) + '  ')
+        elif tag=='table':
+            self.out.append('\n  ')
+            self.nl,self.cap = 1,1
+
+    def md(self): return res+'\n\n' if (res := ''.join(self.out).rstrip()) else ''
+
+# %% ../nbs/03_download.ipynb #3392ae18
+def lxml2md(
+    s:str, # HTML to convert
+    sel:str=None, # Convert only the elements matching CSS selector `sel`
+    multi:bool=False, # Convert all matches to `sel`, rather than only the first
+    wrap_tag:str=None, # If `multi`, wrap each converted match in <wrap_tag>...</wrap_tag>
+    ignore_links:bool=True, # Write links as plain text
+    rm_details:bool=True # Skip `<details>` elements
+)->str: # Markdown
+    "Convert `s` from HTML to markdown in a single pass over an `lxml` tree"
+    import lxml.html
+    root = lxml.html.document_fromstring(s)
+    els = [root] if not sel else root.cssselect(sel) if multi else root.cssselect(sel)[:1]
+    def _md(els):
+        w = _MdWriter(ignore_links=ignore_links, rm_details=rm_details)
+        for o in els:
+            w.walk(o, tail=False)
+            w.sp = True
+        return w.md()
+    if multi and wrap_tag: return '\n'.join(f"\n<{wrap_tag}>\n{_md([o])}</{wrap_tag}>\n" for o in els)
+    return _md(els)
+
 # %% ../nbs/03_download.ipynb #5e897053
-def read_html(
-    url, # URL to read
-    sel=None, # Read only outerHTML of CSS selector `sel`
-    rm_comments=True, # Removes HTML comments
-    rm_details=True, # Removes `<details>` tags
-    multi=False, # Get all matches to `sel` or first one
-    wrap_tag=None, #If multi, each selection wrapped with <wrap_tag>content</wrap_tag>
-    ignore_links=True,
-): # Cleaned markdown
-    "Get `url`, optionally selecting CSS selector `sel`, and convert to clean markdown"
-    page = get(url).text
+def _html2md(page, sel=None, rm_comments=True, rm_details=True, multi=False, wrap_tag=None, ignore_links=True, fast=False):
+    if fast: return lxml2md(page, sel=sel, multi=multi, wrap_tag=wrap_tag, ignore_links=ignore_links, rm_details=rm_details)
     if sel:
         from bs4 import BeautifulSoup
         soup = BeautifulSoup(page, 'html.parser')
@@ -58,15 +321,106 @@ def read_html(
     if wrap_tag: return '\n'.join([f"\n<{wrap_tag}>\n{o}</{wrap_tag}>\n" for o in mds])
     else: return'\n'.join(mds)
 
+def read_html(
+    url, # URL to read
+    sel=None, # Read only outerHTML of CSS selector `sel`
+    rm_comments=True, # Removes HTML comments
+    rm_details=True, # Removes `<details>` tags
+    multi=False, # Get all matches to `sel` or first one
+    wrap_tag=None, #If multi, each selection wrapped with <wrap_tag>content</wrap_tag>
+    ignore_links=True,
+    fast=False, # Convert with `lxml2md` rather than BeautifulSoup and `html2text`
+): # Cleaned markdown
+    "Get `url`, optionally selecting CSS selector `sel`, and convert to clean markdown"
+    return _memo(_html2md, _cget(url).text, sel=sel, rm_comments=rm_comments, rm_details=rm_details,
+                 multi=multi, wrap_tag=wrap_tag, ignore_links=ignore_links, fast=fast)
+
 # %% ../nbs/03_download.ipynb #066b5532
 def get_llmstxt(url, optional=False, n_workers=None):
     "Get llms.txt file from and expand it with `llms_txt.create_ctx()`"
     if not url.endswith('llms.txt'): return None
     import llms_txt
-    resp = get(url)
+    resp = _cget(url)
     if resp.status_code!=200: return None
     return llms_txt.create_ctx(resp.text, optional=optional, n_workers=n_workers)
 
+# %% ../nbs/03_download.ipynb #2789a0bf
+_llms_skip_re = re.compile(r'^<!--.*-->$|<img[^>]*src="data:image/[^"]*"[^>]*>')
+
+def _read_capped(url, max_bytes=None, stop=None):
+    "Text of `url`, reading at most `max_bytes` of it, and giving up early if `stop` is set"
+    buf = bytearray()
+    with stream('GET', url) as r:
+        for o in r.iter_bytes():
+            buf += o
+            if (max_bytes and len(buf)>max_bytes) or (stop and stop.is_set()): break
+    txt = bytes(buf[:max_bytes] if max_bytes else buf).decode(r.encoding or 'utf-8', errors='replace')
+    if max_bytes and len(buf)>max_bytes: txt += f'\n\n[TRUNCATED: {url} exceeds {max_bytes} bytes]'
+    return txt
+
+def _llms_doc(kw, max_doc=None, stop=None):
+    "Rendered `Doc` for llms.txt link `kw`, cleaned as in `llms_txt.create_ctx`"
+    kw = dict(kw)
+    txt = _read_capped(kw.pop('url'), max_doc, stop)
+    return to_xml(Doc('\n'.join(o for o in txt.splitlines() if not _llms_skip_re.search(o)), **kw), do_escape=False)
+
+def _tags(el):
+    "Opening and closing tags of `el` (whose last child is `'\\x00'`) as rendered by `to_xml`"
+    return to_xml(el, do_escape=False).split('\x00')
+
+# %% ../nbs/03_download.ipynb #e647055e
+def get_llmstxt_iter(
+    url:str, # URL of an llms.txt file
+    optional:bool=False, # Include the 'Optional' section?
+    n_workers:int=None, # Number of documents to fetch at once
+    max_doc:int=None, # Read at most this many bytes of each document
+    max_total:int=None # Stop (cancelling remaining fetches) before the output would exceed this many bytes
+):
+    "Generate the context from `get_llmstxt` in order, yielding each linked doc as soon as it's fetched"
+    if not url.endswith('llms.txt'): return
+    import llms_txt
+    resp = _cget(url)
+    if resp.status_code!=200: return
+    d = llms_txt.parse_llms_file(resp.text)
+    sects = [(k,v) for k,v in d.sections.items() if optional or k!='Optional']
+    head,foot = _tags(Project(title=d.title, summary=d.summary)(d.info, '\x00'))
+    stop,ex = Event(),ThreadPoolExecutor(n_workers)
+    futs = [[ex.submit(_llms_doc, o, max_doc, stop) for o in v] for k,v in sects]
+    def closer(sclose, left):
+        "What's needed to end the output inside a section closed by `sclose` (if any) with `left` documents not yet yielded"
+        return (f'\n[OMITTED: {left} documents exceeded max total size of {max_total} bytes]\n' if left else '') + sclose + foot
+    # Each chunk is only yielded if there's still room after it to close the output, so the total never goes past `max_total`
+    def fits(s, sclose, left): return not max_total or total+len(s)+len(closer(sclose, left))<=max_total
+    try:
+        total,left = 0,sum(map(len, futs))
+        if not fits(head, '', left): return
+        yield head
+        total += len(head)
+        for (k,_),fs in zip(sects, futs):
+            sopen,sclose = _tags(ft(k, '\x00'))
+            if not fits(sopen, sclose, left): break
+            yield sopen
+            total += len(sopen)
+            for f in fs:
+                doc = f.result()
+                if not fits(doc, sclose, left-1):
+                    stop.set()
+                    yield closer(sclose, left)
+                    return
+                yield doc
+                total += len(doc)
+                left -= 1
+            yield sclose
+            total += len(sclose)
+        else:
+            yield foot
+            return
+        stop.set()
+        yield closer('', left)
+    finally:
+        stop.set()
+        ex.shutdown(wait=False, cancel_futures=True)
+
 # %% ../nbs/03_download.ipynb #a2fc5a55
 def split_url(url):
     "Split `url` into base, path, and file name, normalising name to '/' if empty"
@@ -80,33 +434,132 @@ def split_url(url):
 # %% ../nbs/03_download.ipynb #5337c0a2
 def _tryget(url):
     "Return response from `url` if `status_code!=404`, otherwise `None`"
-    res = get(url)
+    res = _cget(url)
     return None if res.status_code==404 else url
 
+# %% ../nbs/03_download.ipynb #fbbd3722
+_doc_files = ('/llms.txt', '/index.md', '/index.html.md', '/index-commonmark.md')
+
+def _docs_levels(url):
+    "`(levels, final)`: URLs `find_docs` probes for `url`, a list per level in priority order, and what it returns if none exist"
+    levels = []
+    while True:
+        base,path,fname = split_url(url)
+        url = (base+path+fname).strip('/')
+        if fname=='/llms.txt': return levels, url
+        if Path(fname).suffix in ('.md', '.txt', '.rst'): return levels+[[url]], None
+        if '.' in fname:
+            levels.append([url+'.md'])
+            url = url[:url.rfind('/')]
+            continue
+        levels.append([url+o for o in _doc_files])
+        parsed_url = urlparse(url)
+        if parsed_url.path == '/' or not parsed_url.path: return levels, None
+        url = urljoin(url, '..')
+
 # %% ../nbs/03_download.ipynb #189f5b24
 def find_docs(url):
     "If available, return LLM-friendly llms.txt context or markdown file location from `url`"
-    base,path,fname = split_url(url)
-    url = (base+path+fname).strip('/')
-    if fname=='/llms.txt': return url
-    if Path(fname).suffix in('.md', '.txt', '.rst'): return _tryget(url)
-    if '.' in fname: return _tryget(url+'.md') or find_docs(url[:url.rfind('/')])
-    res = _tryget(url+'/llms.txt')
-    if res: return res
-    res = _tryget(url+'/index.md')
-    if res: return res
-    res = _tryget(url+'/index.html.md')
-    if res: return res
-    res = _tryget(url+'/index-commonmark.md')
-    if res: return res
-    parsed_url = urlparse(url)
-    if parsed_url.path == '/' or not parsed_url.path: return None
-    return find_docs(urljoin(url, '..'))
+    levels,final = _docs_levels(url)
+    for o in concat(levels):
+        if res := _tryget(o): return res
+    return final
 
 # %% ../nbs/03_download.ipynb #771d1208
 def read_docs(url, optional=False, n_workers=None, rm_comments=True, rm_details=True):
     "If available, return LLM-friendly llms.txt context or markdown file response for `url`"
     url = find_docs(url)
     if url.endswith('/llms.txt'): res = get_llmstxt(url, optional=optional, n_workers=n_workers)
-    else: res = get(url).text
+    else: res = _cget(url).text
+    return _memo(clean_md, res, rm_comments=rm_comments, rm_details=rm_details)
+
+# %% ../nbs/03_download.ipynb #2c7042b0
+@asynccontextmanager
+async def _aclient(cli=None):
+    "Yield `cli`, or a new `AsyncClient` that's closed afterwards if `cli` is `None`"
+    if cli is not None: yield cli
+    else:
+        async with AsyncClient() as cli: yield cli
+
+async def _atryget(cli, url):
+    "Like `_tryget`, but using a `HEAD` (or ranged `GET`) request on `cli`"
+    res = await cli.head(url)
+    if res.status_code in (405, 501): res = await cli.get(url, headers={'Range': 'bytes=0-0'})
+    return None if res.status_code==404 else url
+
+# %% ../nbs/03_download.ipynb #aac77bb5
+async def afind_docs(
+    url:str, # URL to find docs for
+    cli:AsyncClient=None, # Client to use; a new one is created (and closed) if not provided
+    all_levels:bool=False # Probe all parent levels at once, rather than one level at a time?
+):
+    "Async `find_docs`, probing candidate locations concurrently on a shared client"
+    levels,final = _docs_levels(url)
+    if all_levels: levels = [concat(levels)]
+    async with _aclient(cli) as cli:
+        for lvl in levels:
+            found = await asyncio.gather(*(_atryget(cli, o) for o in lvl))
+            if res := first(found, bool): return res
+    return final
+
+# %% ../nbs/03_download.ipynb #ac6fdad9
+async def aread_docs(url, optional=False, n_workers=None, rm_comments=True, rm_details=True, cli:AsyncClient=None):
+    "Async `read_docs`, sharing one client for finding and fetching the docs"
+    async with _aclient(cli) as cli:
+        url = await afind_docs(url, cli=cli)
+        if url.endswith('/llms.txt'): res = await asyncio.to_thread(get_llmstxt, url, optional=optional, n_workers=n_workers)
+        else: res = (await cli.get(url)).text
     return clean_md(res, rm_comments=rm_comments, rm_details=rm_details)
+
+# %% ../nbs/03_download.ipynb #1ecd4e53
+DocsResult = namedtuple('DocsResult', 'url loc text error times')
+
+def _timed(f, *args, **kwargs):
+    "`(f(*args, **kwargs), seconds taken)`"
+    start = time.perf_counter()
+    res = f(*args, **kwargs)
+    return res, time.perf_counter()-start
+
+# %% ../nbs/03_download.ipynb #7f374797
+def read_docs_many(
+    urls:list, # URLs to read docs for
+    max_concurrency:int=8, # Maximum number of requests in flight at once
+    per_host_limit:int=4, # Maximum number of requests in flight to any one host
+    optional=False, n_workers=None, rm_comments=True, rm_details=True # Passed on as for `read_docs`
+)->list: # A `DocsResult` for each of `urls`, in the same order
+    "Concurrent `read_docs` for each of `urls`, fetching each docs location just once"
+    lock,sems,fetches = Lock(),{},{}
+    def _limited(url, f, *args, **kwargs):
+        with lock: sem = sems.setdefault(urlparse(url).netloc, BoundedSemaphore(per_host_limit))
+        with sem: return _timed(f, *args, **kwargs)
+
+    def _fetch(loc):
+        try:
+            if loc.endswith('/llms.txt'): res,tf = _limited(loc, get_llmstxt, loc, optional=optional, n_workers=n_workers)
+            else: res,tf = _limited(loc, lambda: _cget(loc).text)
+            if res is None: raise ValueError(f'Could not read {loc}')
+            res,tc = _timed(_memo, clean_md, res, rm_comments=rm_comments, rm_details=rm_details)
+            return res, None, dict(fetch=tf, clean=tc)
+        except Exception as e: return None, e, {}
+
+    def _find(url):
+        try: loc,t = _limited(url, find_docs, url)
+        except Exception as e: return None, e, {}
+        if loc is None: return None, ValueError(f'No docs found for {url}'), dict(find=t)
+        with lock:
+            if loc not in fetches: fetches[loc] = ex.submit(_fetch, loc)
+        return loc, None, dict(find=t)
+
+    with ThreadPoolExecutor(max(max_concurrency,1)) as ex:
+        found = {o: ex.submit(_find, o) for o in dict.fromkeys(urls)}
+        found = {k:v.result() for k,v in found.items()}
+        fetched = {k:v.result() for k,v in fetches.items()}
+    res = []
+    for url in urls:
+        loc,err,times = found[url]
+        text = None
+        if err is None:
+            text,err,t = fetched[loc]
+            times = {**times, **t}
+        res.append(DocsResult(url, loc, text, err, times))
+    return res
@@ -5,15 +5,24 @@ Docs: https://AnswerDotAI.github.io/toolslm/inspecttools.html.md"""
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_inspecttools.ipynb.
 
 # %% auto #0
-__all__ = ['importmodule', 'SymbolNotFound', 'resolve', 'symsrc', 'symtype', 'symval', 'symtype_val', 'symdir', 'symnth',
-           'symlen', 'symslice', 'symsearch', 'symset', 'symfiles_folder', 'symfiles_package']
+__all__ = ['SymLoc', 'symfind_dir', 'importmodule', 'SymbolNotFound', 'resolve', 'symsrc', 'symtype', 'symval', 'symtype_val',
+           'symdir', 'symnth', 'symlen', 'symslice', 'symsearch', 'symset', 'symfiles_folder', 'symfiles_package',
+           'symfind']
 
 # %% ../nbs/05_inspecttools.ipynb #5ae7ad05
 from fastcore.utils import *
 from fastcore.meta import delegates
-import inspect, re, sys, ast, builtins, os, linecache
+import inspect, re, sys, ast, builtins, os, linecache, itertools, hashlib, json
+from collections import namedtuple, defaultdict, OrderedDict, Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from fastcore.xdg import xdg_cache_home
+from itertools import islice, chain
 from inspect import currentframe,Parameter,signature
 from importlib import import_module
+from importlib.machinery import PathFinder
+import importlib.util
+from functools import lru_cache
 
 from .xml import *
 
@@ -49,6 +58,36 @@ class SymbolNotFound(Exception):
     __str__ = __repr__
 
 _last = None
+_split_re,_step_re = re.compile(r'\.(?![^\[]*\])'),re.compile(r'(\w+)\[(\d+)\]$')
+
+@lru_cache(maxsize=4096)
+def _parse_sym(sym:str)->tuple:
+    "Parse dotted path `sym` into `(name, index)` steps, where `index` is `None` if the part has no `[n]`"
+    return tuple((m[1], int(m[2])) if (m := _step_re.match(p)) else (p, None) for p in _split_re.split(sym))
+
+def _resolve(sym, g:dict, memo:dict=None):
+    "Resolve `sym` in namespace `g`, reusing (and adding to) objects for path prefixes in `memo`, if passed"
+    global _last
+    if not isinstance(sym, str): return (_last := sym)
+    if (sym := sym.strip()) == '_last': return _last
+    steps = _parse_sym(sym)
+    name,idx = steps[0]
+    if name=='_last': memo = None
+    n = next((i for i in range(len(steps), 0, -1) if steps[:i] in memo), 0) if memo else 0
+    if n: obj = memo[steps[:n]]
+    else:
+        try: obj = _last if name=='_last' else g[name]
+        except KeyError: raise SymbolNotFound(f"Symbol '{name}' not found. Consider using `importmodule` first.")
+        if idx is not None: obj = obj[idx]
+        n = 1
+        if memo is not None: memo[steps[:1]] = obj
+    for i in range(n, len(steps)):
+        attr,idx = steps[i]
+        obj = getattr(obj, attr)
+        if idx is not None: obj = obj[idx]
+        if memo is not None: memo[steps[:i+1]] = obj
+    _last = obj
+    return obj
 
 def resolve(
     sym: str  # Dotted symbol path, with optional [n] indexing, e.g. "module.attr.subattr[1]" or "_last" for previous result
@@ -61,24 +100,115 @@ def resolve(
 
     - `resolve("sympy.sets.sets.Interval")` -> `<class 'sympy.sets.sets.Interval'>`
     - `resolve("mylist[2]")` -> third element of mylist"""
-    global _last
-    if not isinstance(sym, str): return (_last := sym)
-    if (sym := sym.strip()) == '_last': return _last
-    g = _find_frame_dict('__dialog_name')
-    if match := re.match(r'^(\w+)\[(\d+)\]$', sym):
-        attr, idx = match.groups()
-        parts, _last = ['_last'], _last[int(idx)] if attr == '_last' else g[attr][int(idx)]
-    else: parts = re.split(r'\.(?![^\[]*\])', sym)
-    try: obj = _last if parts[0] == '_last' else g[parts[0]]
-    except KeyError: raise SymbolNotFound(f"Symbol '{parts[0]}' not found. Consider using `importmodule` first.")
-    for part in parts[1:]:
-        match = re.match(r'(\w+)\[(\d+)\]$', part)
-        if match:
-            attr, idx = match.groups()
-            obj = getattr(obj, attr)[int(idx)]
-        else: obj = getattr(obj, part)
-    _last = obj
-    return obj
+    return _resolve(sym, _find_frame_dict('__dialog_name'))
+
+# %% ../nbs/05_inspecttools.ipynb #5ee6d579
+def _static_spec(parts:list):
+    "Find the spec for the longest module prefix of `parts` without importing anything, returning `(spec, n_parts)`"
+    spec,n = None,0
+    for i in range(len(parts)):
+        name = '.'.join(parts[:i+1])
+        try:
+            if i==0: s = importlib.util.find_spec(name)
+            elif spec.submodule_search_locations is None: s = None
+            else: s = PathFinder.find_spec(name, spec.submodule_search_locations)
+        except (ImportError, ValueError): s = None
+        if s is None: break
+        spec,n = s,i+1
+    return spec,n
+
+def _spec_file(spec)->str:
+    "Path of the Python source for `spec` (including frozen standard library modules), or `None`"
+    if spec is None: return None
+    fname = getattr(spec.loader_state, 'filename', None) if spec.origin=='frozen' else spec.origin
+    return fname if (fname or '').endswith('.py') else None
+
+def _abs_mod(mod:str, level:int, modname:str, is_pkg:bool)->str:
+    "Absolute name of module `mod` imported with relative `level` from module `modname`"
+    if not level: return mod
+    base = modname.split('.')
+    if not is_pkg: base = base[:-1]
+    if level>1: base = base[:-(level-1)]
+    return '.'.join(base+([mod] if mod else []))
+
+# %% ../nbs/05_inspecttools.ipynb #d90174a1
+_def_types = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+def _walk_stmts(body:list, q:str=''):
+    "Yield `(node, q)` for the statements in `body` and the classes and `if`/`try`/`with` blocks in it, where `q` is the qualname of the enclosing class"
+    for o in body:
+        if isinstance(o, (ast.If, ast.Try, ast.With)):
+            yield from _walk_stmts(getattr(o, 'body', []) + getattr(o, 'orelse', []) + getattr(o, 'finalbody', []), q)
+            for h in getattr(o, 'handlers', []): yield from _walk_stmts(h.body, q)
+            continue
+        yield o,q
+        if isinstance(o, ast.ClassDef): yield from _walk_stmts(o.body, f'{q}.{o.name}' if q else o.name)
+
+def _def_start(o)->int:
+    "First line of definition `o`, including its decorators"
+    return min([d.lineno for d in o.decorator_list]+[o.lineno])
+
+def _target_names(o)->list:
+    "Names assigned to by assignment `o`"
+    return [n.id for t in getattr(o, 'targets', [getattr(o, 'target', None)]) for n in ast.walk(t) if isinstance(n, ast.Name)]
+
+@lru_cache(maxsize=256)
+def _ast_index(fname:str, mtime:float)->dict:
+    "Index of the definitions, names, imports, and `__all__` in the source of `fname`"
+    defs,members,imports,stars,all_ = {},{'':[]},{},[],None
+    try: tree = ast.parse(''.join(linecache.getlines(fname)))
+    except (SyntaxError, ValueError): tree = ast.Module(body=[])
+    # The first import of a name is kept, since that's usually the preferred one of the alternatives in `if`/`try` blocks
+    for o,q in _walk_stmts(tree.body):
+        names = []
+        if isinstance(o, _def_types):
+            qn,names = f'{q}.{o.name}' if q else o.name,[o.name]
+            defs[qn] = _def_start(o)-1,o.end_lineno
+            if isinstance(o, ast.ClassDef): members[qn] = []
+        elif isinstance(o, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            names = _target_names(o)
+            if not q and '__all__' in names and o.value is not None:
+                try: val = list(ast.literal_eval(o.value))
+                except (ValueError, TypeError): val = None
+                # `__all__ += [...]` extends it; if any part isn't a literal we can't tell which names are public
+                if isinstance(o, ast.AugAssign): all_ = all_+val if all_ is not None and val is not None else None
+                else: all_ = val
+        elif isinstance(o, ast.Import):
+            for a in o.names:
+                names.append(nm := a.asname or a.name.split('.')[0])
+                if not q: imports.setdefault(nm, ((a.name if a.asname else nm),None,0))
+        elif isinstance(o, ast.ImportFrom):
+            for a in o.names:
+                if a.name=='*':
+                    if not q: stars.append((o.module, o.level))
+                    continue
+                names.append(nm := a.asname or a.name)
+                if not q: imports.setdefault(nm, (o.module,a.name,o.level))
+        members[q].extend(names)
+    return dict(defs=defs, members=members, imports=imports, stars=stars, all=all_)
+
+def _static_lookup(sym:str, depth:int=0):
+    "Find the source file, its index, and the qualified name within it of dotted path `sym`, or `None`, without importing"
+    parts = sym.split('.')
+    spec,n = _static_spec(parts)
+    if not (fname := _spec_file(spec)) or depth>8: return None
+    rest,is_pkg = parts[n:],spec.submodule_search_locations is not None
+    linecache.checkcache(fname)
+    idx = _ast_index(fname, os.path.getmtime(fname))
+    q = '.'.join(rest)
+    if not rest or q in idx['defs'] or (len(rest)==1 and q in idx['members'][''] and q not in idx['imports']):
+        return fname,idx,q
+    name,tail = rest[0],rest[1:]
+    if name in idx['imports']:
+        mod,attr,level = idx['imports'][name]
+        tgt = [_abs_mod(mod, level, spec.name, is_pkg)] + ([attr] if attr else [])
+        return _static_lookup('.'.join(tgt+tail), depth+1)
+    for mod,level in idx['stars']:
+        mod = _abs_mod(mod, level, spec.name, is_pkg)
+        if sfname := _spec_file(_static_spec(mod.split('.'))[0]):
+            all_ = _ast_index(sfname, os.path.getmtime(sfname))['all']
+            if all_ is not None and name not in all_: continue
+        if res := _static_lookup('.'.join([mod]+rest), depth+1): return res
 
 # %% ../nbs/05_inspecttools.ipynb #659bf879
 def _src_from_lines(lines, start):
@@ -89,10 +219,61 @@ def _src_from_lines(lines, start):
     if not tree.body: return None
     return ''.join(lines[start:start + tree.body[0].end_lineno])
 
+# %% ../nbs/05_inspecttools.ipynb #ee08a853
+_def_re = re.compile(r'(?:class|def)\s+(\w+)')
+_def_entries,_def_names = {},{}
+
+def _defs(lines)->dict:
+    "Map names of top-level classes and functions in `lines` to their 0-indexed `(start, end)` line spans"
+    try: tree = ast.parse(''.join(lines))
+    except (SyntaxError, ValueError): tree = None
+    res = {}
+    if tree:
+        for o in tree.body:
+            if isinstance(o, (ast.ClassDef, ast.FunctionDef)): res.setdefault(o.name, (o.lineno-1, o.end_lineno))
+        return res
+    # Fall back to parsing each definition separately if the whole file isn't valid
+    for i,l in enumerate(lines):
+        if (m := _def_re.match(l)) and m[1] not in res and (src := _src_from_lines(lines, i)):
+            res[m[1]] = (i, i+src.count('\n')+(not src.endswith('\n')))
+    return res
+
+def _sync_defs():
+    "Update the index of definitions for `linecache` entries that were added, changed, or removed"
+    cache = linecache.cache
+    for fname in [f for f,(entry,_) in _def_entries.items() if cache.get(f) is not entry]:
+        for name in _def_entries.pop(fname)[1]:
+            fnames = _def_names[name]
+            fnames.pop(fname, None)
+            if not fnames: del _def_names[name]
+    for fname,entry in list(cache.items()):
+        if fname in _def_entries or len(entry)!=4: continue
+        defs = _defs(entry[2])
+        _def_entries[fname] = entry,defs
+        for name,span in defs.items(): _def_names.setdefault(name, {})[fname] = span
+
+def _find_def(name:str):
+    "Find `(file, source)` of the top-level class or function `name` in `linecache`, or `None`"
+    _sync_defs()
+    for fname,(start,end) in _def_names.get(name, {}).items():
+        return fname, ''.join(_def_entries[fname][0][2][start:end])
+
+# %% ../nbs/05_inspecttools.ipynb #bfe4a431
+def _static_src(sym:str)->str:
+    "Source of the module, class or function at dotted path `sym`, found without importing"
+    if not (found := _static_lookup(sym)): return f"Symbol '{sym}' not found in module sources"
+    fname,idx,q = found
+    lines = linecache.getlines(fname)
+    if not q: return f"# File: {fname}\n\n{''.join(lines)}"
+    if q not in idx['defs']: return f"'{sym}' is not a class or function; it's defined in {fname}"
+    start,end = idx['defs'][q]
+    return f"# File: {fname}\n\n{''.join(lines[start:end])}"
+
 # %% ../nbs/05_inspecttools.ipynb #41ecbd5c
 @llmtool
 def symsrc(
-    sym: str  # Dotted symbol path (e.g `Interval` or `sympy.sets.sets.Interval`) or "_last" for previous result
+    sym: str,  # Dotted symbol path (e.g `Interval` or `sympy.sets.sets.Interval`) or "_last" for previous result
+    static: bool=False # Read the source of a full module path (e.g `sympy.sets.sets.Interval`) without importing anything
 ):
     """Get the source code for a symbol.
 
@@ -101,7 +282,9 @@ def symsrc(
     - `symsrc("Interval")` -> source code of Interval class if it's already imported
     - `symsrc("sympy.sets.sets.Interval")` -> source code of Interval class
     - `symsrc("_last")` -> source of object from previous tool call
+    - `symsrc("torch.nn.functional.relu", static=True)` -> source of relu, without importing torch
     - For dispatchers or registries of callables: `symnth("module.dispatcher.funcs", n) then symsrc("_last")`"""
+    if static: return _static_src(sym)
     try: obj = resolve(sym)
     except SymbolNotFound as e: return str(e)
     if isinstance(obj, type) or callable(obj): pass
@@ -112,12 +295,7 @@ def symsrc(
     except (OSError, TypeError): pass
     name = getattr(obj, '__name__', None)
     if not name: raise OSError(f"Cannot get source for {sym}")
-    pat = rf'^(class|def)\s+{name}\b'
-    for fname, (_, _, lines, _) in linecache.cache.items():
-        src = ''.join(lines)
-        if match := re.search(pat, src, re.MULTILINE):
-            start = src[:match.start()].count('\n')
-            if extracted := _src_from_lines(lines, start): return f"# File: {fname}\n\n{extracted}"
+    if found := _find_def(name): return f"# File: {found[0]}\n\n{found[1]}"
     raise OSError(f"Source for {name} not found")
 
 # %% ../nbs/05_inspecttools.ipynb #bbf67405
@@ -132,15 +310,75 @@ def symtype(
     - `symtype("sympy.sets.sets.Interval")` -> `<class 'type'>`
     - `symtype("doesnotexist")` -> `'SymbolNotFound`
     - `symtype("_last")` -> type of previous result"""
+    g,memo = _find_frame_dict('__dialog_name'),{}
     def f(o):
-        try: return type(resolve(o))
+        try: return type(_resolve(o, g, memo))
         except SymbolNotFound as e: return str(e)
     return [f(o) for o in re.split(r'\,\s*', syms)]
 
+# %% ../nbs/05_inspecttools.ipynb #b1eddfea
+def _size_info(o)->str:
+    "Description of the size of `o` (its `shape` and/or `len`), if available"
+    res = []
+    if isinstance(shape := getattr(o, 'shape', None), tuple): res.append(f'shape={shape}')
+    try: res.append(f'len={len(o)}')
+    except Exception: pass
+    return '; '.join(res)
+
+_strs = (str, bytes, bytearray)
+
+def _container(o):
+    "`(prefix, brackets, items, is_map, suffix)` to render `repr(o)` item by item, or `None` if `o` isn't a container with a known `repr`"
+    r,n = type(o).__repr__,type(o).__name__
+    if r is list.__repr__: return '', '[]', o, False, ''
+    if r is tuple.__repr__: return '', '()', o, False, ''
+    if r is dict.__repr__: return '', '{}', o.items(), True, ''
+    if r in (set.__repr__, frozenset.__repr__): return ('', '{}', o, False, '') if type(o) is set else (n+'(', '{}', o, False, ')')
+    if r is defaultdict.__repr__: return f'{n}({o.default_factory!r}, ', '{}', o.items(), True, ')'
+    if r is Counter.__repr__:
+        try: items = o.most_common()
+        except TypeError: items = o.items()
+        return n+'(', '{}', items, True, ')'
+    if r is OrderedDict.__repr__: return (n+'(', '{}', o.items(), True, ')') if sys.version_info>=(3,12) else (n+'(', '[]', o.items(), False, ')')
+    if r is deque.__repr__: return n+'(', '[]', o, False, ')' if o.maxlen is None else f', maxlen={o.maxlen})'
+
+def _repr_chunks(o, seen:set, max_len:int=None):
+    "Yield the parts of `repr(o)`, rendering containers lazily and only the first `max_len` items of strings, so that rendering can stop part way"
+    if type(o) in _strs and max_len and len(o)>max_len: o = o[:max_len]
+    if not (c := _container(o)) or not o: yield repr(o); return
+    pre,brackets,items,is_map,suf = c
+    if id(o) in seen: yield pre+'...'.join(brackets)+suf; return
+    seen.add(id(o))
+    yield pre+brackets[0]
+    for i,x in enumerate(items):
+        if i: yield ', '
+        if is_map:
+            yield from _repr_chunks(x[0], seen, max_len)
+            yield ': '
+            x = x[1]
+        yield from _repr_chunks(x, seen, max_len)
+    if brackets=='()' and len(o)==1: yield ','
+    yield brackets[1]+suf
+    seen.discard(id(o))
+
+def _bounded_repr(o, max_bytes:int=None)->str:
+    "`repr(o)`, cut at `max_bytes` bytes of UTF-8 with a note of the size of `o` if it's longer"
+    if max_bytes is None: return repr(o)
+    parts,n = [],0
+    for c in _repr_chunks(o, set(), max_bytes+1):
+        parts.append(c)
+        n += len(c.encode(errors='replace'))
+        if n>max_bytes: break
+    else: return ''.join(parts)
+    res = ''.join(parts).encode(errors='replace')[:max_bytes].decode(errors='ignore')
+    info = _size_info(o)
+    return f"{res}... [truncated at {max_bytes} bytes{'; '+info if info else ''}]"
+
 # %% ../nbs/05_inspecttools.ipynb #dd4279b8
 @llmtool
 def symval(
-    syms: str  # Comma separated str list of dotted symbol paths (e.g `Interval` or `sympy.sets.sets.Interval`); "_last" for prev result
+    syms: str,  # Comma separated str list of dotted symbol paths (e.g `Interval` or `sympy.sets.sets.Interval`); "_last" for prev result
+    max_bytes: int=10_000 # Maximum size of each repr; longer ones are truncated, with their size noted
 ):
     """List of repr of symbols' values.
 
@@ -149,36 +387,49 @@ def symval(
     - `symval("sympy.sets.sets.Interval")` -> `[<class 'sympy.sets.sets.Interval'>]`
     - `symval("some_dict.keys")` -> `[dict_keys([...])]`
     - `symval("a,notexist")` -> `['foo','SymbolNotFound']`"""
+    g,memo = _find_frame_dict('__dialog_name'),{}
     def f(o):
-        try: return repr(resolve(o))
+        try: return _bounded_repr(_resolve(o, g, memo), max_bytes)
         except SymbolNotFound as e: return str(e)
     return [f(o) for o in re.split(r'\,\s*', syms)]
 
 # %% ../nbs/05_inspecttools.ipynb #3cb05b78
 def symtype_val(
-    syms: str  # Comma separated str list of dotted symbol paths (e.g `Interval` or `sympy.sets.sets.Interval`); "_last" for prev result
+    syms: str,  # Comma separated str list of dotted symbol paths (e.g `Interval` or `sympy.sets.sets.Interval`); "_last" for prev result
+    max_bytes: int=10_000 # Maximum size of each repr; longer ones are truncated, with their size noted
 ):
     """List of 2-ple of (type,repr) of symbols' values.
 
     Examples:
     
     - `symtype_val("a,c,notexist")` -> `[(<class 'str'>,'foo'),(<class 'int'>,1), 'SymbolNotFound']`"""
+    g,memo = _find_frame_dict('__dialog_name'),{}
     def f(o):
-        try: r = resolve(o)
+        try: r = _resolve(o, g, memo)
         except SymbolNotFound as e: return 'SymbolNotFound'
-        return (type(r), repr(r))
+        return (type(r), _bounded_repr(r, max_bytes))
     return [f(o) for o in re.split(r'\,\s*', syms)]
 
 # %% ../nbs/05_inspecttools.ipynb #1cd34596
 @llmtool
 def symdir(
     sym: str,  # Dotted symbol path (e.g `Interval` or `sympy.sets.sets.Interval`) or "_last" for previous result
-    exclude_private: bool=False # Filter out attrs starting with "_"
+    exclude_private: bool=False, # Filter out attrs starting with "_"
+    static: bool=False, # List the names defined in a module or class (from a full module path) without importing anything
+    limit: int=None, # Maximum number of names to return (default: all)
+    offset: int=0, # Number of names to skip
+    cursor: str=None # Continuation token from a previous call with `limit`, to get the next page (other args are then ignored)
 ):
-    """Get dir() listing of a symbol's attributes and set `_last`. E.g: `symdir("sympy.Interval")` -> `['__add__', '__and__', ...]`"""
-    res = dir(resolve(sym))
-    if not exclude_private: return res
-    return [o for o in res if o[0]!='_']
+    """Get dir() listing of a symbol's attributes and set `_last`. E.g: `symdir("sympy.Interval")` -> `['__add__', '__and__', ...]`.
+    With `limit` or `offset`, returns a page of the listing as a str, like `symsearch`"""
+    if cursor: return _page(None, limit, cursor=cursor)
+    if static:
+        if not (found := _static_lookup(sym)): return f"Symbol '{sym}' not found in module sources"
+        fname,idx,q = found
+        res = sorted(set(idx['members'].get(q, [])))
+    else: res = dir(resolve(sym))
+    if exclude_private: res = [o for o in res if o[0]!='_']
+    return res if limit is None and not offset else _page(res, limit, offset)
 
 # %% ../nbs/05_inspecttools.ipynb #9542de0b
 @llmtool
@@ -193,7 +444,12 @@ def symnth(
     - `symnth("dispatcher.funcs", 12)` -> 13th registered function
     - `symnth("dispatcher.funcs", 0); symsrc("_last")` -> source of first handler"""
     global _last
-    _last = list(resolve(sym).values())[n]
+    vals = resolve(sym).values()
+    if n<0: n += len(vals)
+    try:
+        if n<0: raise StopIteration
+        _last = next(islice(vals, n, None))
+    except StopIteration: raise IndexError(f'{sym} has no value {n}') from None
     return _last
 
 # %% ../nbs/05_inspecttools.ipynb #4ac6ca2d
@@ -212,21 +468,47 @@ def symslice(
     end: int    # Ending index for slice
 ):
     "Returns the contents of the symbol from the given start to the end."
-    try: return resolve(sym)[start:end]
+    try: obj = resolve(sym)
+    except Exception as e: return f'Error: {e}'
+    try: return obj[start:end]
+    except TypeError as e:
+        if not hasattr(obj, '__iter__') or start<0 or end<0: return f'Error: {e}'
+        return list(islice(obj, start, end))
     except Exception as e: return f'Error: {e}'
 
 # %% ../nbs/05_inspecttools.ipynb #5fca4d70
+_cursors,_cursor_ids = {},itertools.count()
+
+def _page(it, limit:int=None, offset:int=0, cursor:str=None, max_cursors:int=32)->str:
+    "str of the list of up to `limit` items of `it` after `offset`, or continuing from `cursor`, with a note on how to get more"
+    if cursor:
+        if cursor not in _cursors: return f'Error: cursor {cursor!r} not found; it may have expired'
+        it,offset,prev = _cursors.pop(cursor)
+        limit = ifnone(limit, prev)
+    else: it = islice(it, offset, None)
+    res = list(islice(it, limit+1) if limit is not None else it)
+    if limit is None or len(res)<=limit: return str(res)
+    tok = f'c{next(_cursor_ids)}'
+    _cursors[tok] = chain(res[limit:], it),offset+limit,limit
+    while len(_cursors)>max_cursors: del _cursors[next(iter(_cursors))]
+    return f"{res[:limit]}\n[results {offset}-{offset+limit-1}; for more pass cursor={tok!r}, or offset={offset+limit}]"
+
 @llmtool
 def symsearch(
     sym:str,      # Dotted symbol path or "_last" for previous result
     term:str,     # Search term (exact string or regex pattern)
     regex:bool=True,  # If True, regex search; if False, exact match
-    flags:int=0   # Regex flags (e.g., re.IGNORECASE)
+    flags:int=0,  # Regex flags (e.g., re.IGNORECASE)
+    limit:int=None, # Maximum number of results to return (default: all)
+    offset:int=0, # Number of results to skip
+    cursor:str=None # Continuation token from a previous call with `limit`, to get the next page (`sym` and `term` are then ignored)
 ):
     """Search contents of symbol, which is assumed to be str for regex, or iterable for non-regex.
     Regex mode returns (match, start, end) tuples; otherwise returns (item, index) tuples"""
-    if regex: return str([(m.group(), m.start(), m.end()) for m in re.finditer(term, resolve(sym), flags)])
-    else: return str([(x, i) for i, x in enumerate(resolve(sym)) if x == term])
+    if cursor: return _page(None, limit, cursor=cursor)
+    if regex: it = ((m.group(), m.start(), m.end()) for m in re.finditer(term, resolve(sym), flags))
+    else: it = ((x, i) for i, x in enumerate(resolve(sym)) if x == term)
+    return _page(it, limit, offset)
 
 # %% ../nbs/05_inspecttools.ipynb #02c09e1a
 def symset(
@@ -258,3 +540,101 @@ def symfiles_package(
     try: s = resolve(sym)
     except SymbolNotFound as e: return str(e)
     return sym2pkgctx(s, **kwargs)
+
+# %% ../nbs/05_inspecttools.ipynb #6ca7cb2b
+SymLoc = namedtuple('SymLoc', 'path kind file start end')
+symfind_dir = xdg_cache_home()/'toolslm'/'symfind'
+_sym_idxs,_sym_lock = {},Lock()
+
+def _file_syms(fname)->list:
+    "`[qualname, kind, start, end]` for each class, function and assignment in the Python source `fname`"
+    try: tree = ast.parse(Path(fname).read_bytes())
+    except (SyntaxError, ValueError, OSError): return []
+    res = []
+    for o,q in _walk_stmts(tree.body):
+        if isinstance(o, _def_types):
+            res.append([f'{q}.{o.name}' if q else o.name, 'class' if isinstance(o, ast.ClassDef) else 'def', _def_start(o), o.end_lineno])
+        elif isinstance(o, (ast.Assign, ast.AnnAssign)):
+            res.extend([f'{q}.{n}' if q else n, 'var', o.lineno, o.end_lineno] for n in _target_names(o))
+    return res
+
+def _py_files(root:Path)->dict:
+    "Map of the paths (relative to `root`) of Python files in `root` to their `mtime_ns`"
+    res,todo = {},[root]
+    while todo:
+        with os.scandir(todo.pop()) as it:
+            for o in it:
+                if o.name.startswith('.') or o.name=='__pycache__': continue
+                if o.is_dir(): todo.append(o.path)
+                elif o.name.endswith('.py'): res[os.path.relpath(o.path, root)] = o.stat().st_mtime_ns
+    return res
+
+def _pkg_root(pkg:str)->Path:
+    "Folder of top-level package `pkg`, found without importing it if it isn't already"
+    name = pkg.split('.')[0]
+    if m := sys.modules.get(name): return sym2pkgpath(m)
+    spec,_ = _static_spec([name])
+    if not spec or not spec.submodule_search_locations: raise SymbolNotFound(f"Package '{name}' not found")
+    return Path(list(spec.submodule_search_locations)[0])
+
+def _sym_index(root:Path, n_workers:int=None)->dict:
+    "Index of the symbols defined in each file in `root`, updated for files which changed since it was last used or saved"
+    fn = symfind_dir/f'{root.name}-{hashlib.md5(str(root).encode()).hexdigest()[:8]}.json' if symfind_dir else None
+    with _sym_lock:
+        idx = _sym_idxs.get(root)
+        if idx is None and fn and fn.exists():
+            try: idx = json.loads(fn.read_text())
+            except ValueError: idx = None
+        idx = idx or {}
+        files = _py_files(root)
+        todo = [k for k,mt in files.items() if k not in idx or idx[k][0]!=mt]
+        changed = bool(todo) or any(k not in files for k in idx)
+        idx = {k:v for k,v in idx.items() if k in files}
+        if todo:
+            paths = [str(root/k) for k in todo]
+            if n_workers is None: n_workers = defaults.cpus if len(todo)>=64 and defaults.cpus>1 else 0
+            if n_workers:
+                with ProcessPoolExecutor(n_workers) as ex: syms = list(ex.map(_file_syms, paths, chunksize=16))
+            else: syms = map(_file_syms, paths)
+            idx.update({k:[files[k],s] for k,s in zip(todo, syms)})
+        _sym_idxs[root] = idx
+        if fn and changed:
+            with atomic_save(fn, 'w') as f: f.write(json.dumps(idx))
+    return idx
+
+def _modname(pkg:str, rel:str)->str:
+    "Dotted module name of the file at path `rel` in package `pkg`"
+    parts = [pkg,*Path(rel).with_suffix('').parts]
+    return '.'.join(parts[:-1] if parts[-1]=='__init__' else parts)
+
+# %% ../nbs/05_inspecttools.ipynb #5dbf5a2f
+@llmtool
+def symfind(
+    pkg:str, # Name of an installed package, which need not be imported (e.g `sympy`)
+    pattern:str, # Regex to search for in symbol names (e.g `^Interval$`)
+    full:bool=False, # Search the full dotted path (e.g `sets.*Interval`) instead of just the name
+    kinds:str='class,def,var', # Comma separated kinds of symbol to include
+    limit:int=50 # Maximum number of results
+)->list:
+    """Find where classes, functions and variables matching `pattern` are defined in package `pkg`.
+    Returns `SymLoc(path, kind, file, start, end)` tuples, where `path` can be passed to tools like `symsrc`, and `start` and `end` are line numbers in `file`.
+
+    Examples:
+
+    - `symfind("sympy", "^Interval$")` -> `[SymLoc(path='sympy.sets.sets.Interval', kind='class', ...)]`
+    - `symfind("fastcore", "^L\\.", full=True)` -> methods of `L` in `fastcore.foundation`"""
+    try: root = _pkg_root(pkg)
+    except SymbolNotFound as e: return [str(e)]
+    idx,name = _sym_index(root),root.name
+    pat,kinds,res = re.compile(pattern),set(re.split(r',\s*', kinds)),[]
+    for rel,(_,syms) in idx.items():
+        mod = None
+        for q,kind,start,end in syms:
+            if kind not in kinds: continue
+            if full:
+                mod = mod or _modname(name, rel)
+                if not pat.search(f'{mod}.{q}'): continue
+            elif not pat.search(q.rsplit('.', 1)[-1]): continue
+            res.append(SymLoc(f'{mod or _modname(name, rel)}.{q}', kind, str(root/rel), start, end))
+            if len(res)>=limit: return res
+    return res
@@ -5,58 +5,385 @@ Docs: https://AnswerDotAI.github.io/toolslm/minipy.html.md"""
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_minipy.ipynb.
 
 # %% auto #0
-__all__ = ['minipy']
+__all__ = ['ExecMetrics', 'capture_output', 'compile_cache_info', 'CPUTimeoutError', 'minipy', 'aminipy', 'MiniPyPool']
 
 # %% ../nbs/01_minipy.ipynb #873000d7
-import ast, signal, traceback, inspect
+import ast, signal, traceback, inspect, zlib, ctypes, threading, asyncio, time, multiprocessing as mp
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from threading import Lock
 from fastcore.utils import *
 from typing import Optional
 
 # %% ../nbs/01_minipy.ipynb #4703296a
 def _copy_loc(new, orig):
-    "Copy location information from original node to new node and all children."
-    new = ast.copy_location(new, orig)
-    for field, o in ast.iter_fields(new):
-        if isinstance(o, ast.AST): setattr(new, field, _copy_loc(o, orig))
-        elif isinstance(o, list): setattr(new, field, [_copy_loc(value, orig) for value in o])
+    "Copy location information from `orig` to `new` and any of its descendants that don't have it"
+    todo = [new]
+    while todo:
+        o = todo.pop()
+        if 'lineno' in o._attributes:
+            if getattr(o, 'lineno', None) is not None: continue
+            ast.copy_location(o, orig)
+        todo.extend(ast.iter_child_nodes(o))
     return new
 
+# %% ../nbs/01_minipy.ipynb #d8427421
+_capture = ContextVar('_capture', default=None)
+_cap_lock,_cap_n,_cap_orig = Lock(),0,None
+
+class _Output:
+    "Buffer for captured text, keeping at most `max_size` chars, and counting the bytes written in `nbytes`"
+    def __init__(self, max_size=None): self.parts,self.size,self.dropped,self.nbytes,self.max_size = [],0,0,0,max_size
+    def write(self, s):
+        n = len(s)
+        self.nbytes += n if s.isascii() else len(s.encode(errors='replace'))
+        if self.max_size is not None and self.size+n>self.max_size:
+            keep = max(self.max_size-self.size, 0)
+            self.dropped += n-keep
+            s = s[:keep]
+        if s:
+            self.parts.append(s)
+            self.size += len(s)
+        return n
+    def flush(self): pass
+    def getvalue(self):
+        res = ''.join(self.parts)
+        return res + f'\n[TRUNCATED: {self.dropped} more chars of output]' if self.dropped else res
+
+class _CtxStream:
+    "Stand-in for `sys.stdout` (`idx=0`) or `sys.stderr` (`idx=1`) writing to the current context's capture, if any, else `stream`"
+    def __init__(self, stream, idx): self.stream,self.idx = stream,idx
+    def write(self, s):
+        cap = _capture.get()
+        return (cap[self.idx] if cap else self.stream).write(s)
+    def flush(self):
+        if not _capture.get(): self.stream.flush()
+    def __getattr__(self, k): return getattr(self.stream, k)
+
+# %% ../nbs/01_minipy.ipynb #a888f4e1
+@contextmanager
+def capture_output(max_size:int=None):
+    "Capture stdout and stderr written in the current thread or task, yielding `(out, err)` buffers with `getvalue()`"
+    global _cap_n,_cap_orig
+    with _cap_lock:
+        if not _cap_n:
+            _cap_orig = sys.stdout,sys.stderr
+            sys.stdout,sys.stderr = _CtxStream(sys.stdout, 0),_CtxStream(sys.stderr, 1)
+        _cap_n += 1
+    cap = _Output(max_size),_Output(max_size)
+    tok = _capture.set(cap)
+    try: yield cap
+    finally:
+        _capture.reset(tok)
+        with _cap_lock:
+            _cap_n -= 1
+            # Put the original streams back, unless something else has replaced the stand-ins since
+            if not _cap_n:
+                if isinstance(sys.stdout, _CtxStream): sys.stdout = _cap_orig[0]
+                if isinstance(sys.stderr, _CtxStream): sys.stderr = _cap_orig[1]
+
 # %% ../nbs/01_minipy.ipynb #1574585f
-def _run(code:str, glb:dict=None, loc:dict=None):
-    "Run `code`, returning final expression (similar to IPython)"
-    tree = ast.parse(code)
-    last_node = tree.body[-1] if tree.body else None
-    
+@lru_cache(maxsize=1024)
+def _compile(code:str, mode:str='exec', flags:int=0):
+    "Compile `code`, assigning a final expression to `_result` (cached on `code`, `mode` and `flags`)"
+    tree = ast.parse(code, mode=mode)
+    last_node = tree.body[-1] if mode=='exec' and tree.body else None
+
     # If the last node is an expression, modify the AST to capture the result
     if isinstance(last_node, ast.Expr):
         tgt = [ast.Name(id='_result', ctx=ast.Store())]
         assign_node = ast.Assign(targets=tgt, value=last_node.value)
         tree.body[-1] = _copy_loc(assign_node, last_node)
+    return compile(tree, filename='<ast>', mode=mode, flags=flags)
 
-    compiled_code = compile(tree, filename='<ast>', mode='exec')
-    glb = glb or {}
-    stdout_buffer = io.StringIO()
-    saved_stdout = sys.stdout
-    sys.stdout = stdout_buffer
-    try: exec(compiled_code, glb, loc)
-    finally: sys.stdout = saved_stdout
+def compile_cache_info()->dict:
+    "Statistics for the cache of compiled code used by `minipy`"
+    ci = _compile.cache_info()
+    n = ci.hits+ci.misses
+    return dict(hits=ci.hits, misses=ci.misses, size=ci.currsize, maxsize=ci.maxsize, hit_rate=ci.hits/n if n else 0.)
+
+def _output(glb, out, err):
+    "The final expression stored in `glb` if there is one, otherwise the captured output"
     _result = glb.get('_result', None)
     if _result is not None: return _result
-    return stdout_buffer.getvalue().strip()
+    return (out.getvalue() + err.getvalue()).strip()
+
+def _run(code:str, glb:dict=None, loc:dict=None, max_output:int=None, stats:dict=None):
+    "Run `code`, returning final expression (similar to IPython), or else what it printed"
+    t0 = time.perf_counter()
+    compiled_code = _compile(code)
+    t1 = time.perf_counter()
+    glb = glb or {}
+    glb.pop('_result', None)
+    with capture_output(max_output) as (out,err):
+        try: exec(compiled_code, glb, loc)
+        finally:
+            if stats is not None: stats.update(compile_time=t1-t0, exec_time=time.perf_counter()-t1, stdout_bytes=out.nbytes)
+    return _output(glb, out, err)
 
 # %% ../nbs/01_minipy.ipynb #81857615
+def _raise_in(tid, exc):
+    "Raise `exc` in thread `tid` when it next runs Python code, or clear a pending one if `exc` is `None`"
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(tid), ctypes.py_object(exc) if exc else None)
+
+@contextmanager
+def _time_limit(timeout):
+    "Raise `TimeoutError` if the block runs for more than `timeout` seconds, using `SIGALRM` on the main thread"
+    if not timeout:
+        yield
+        return
+    if threading.current_thread() is threading.main_thread() and hasattr(signal, 'SIGALRM'):
+        def handler(*args): raise TimeoutError()
+        signal.signal(signal.SIGALRM, handler)
+        signal.alarm(timeout)
+        try: yield
+        finally: signal.alarm(0)
+        return
+    lock,tid,state = Lock(),threading.get_ident(),{}
+    def _fire():
+        with lock:
+            if state: return
+            state['fired'] = True
+            _raise_in(tid, TimeoutError)
+    timer = threading.Timer(timeout, _fire)
+    timer.daemon = True
+    timer.start()
+    try: yield
+    finally:
+        with lock: fired = state.setdefault('fired', False)
+        timer.cancel()
+        if fired: _raise_in(tid, None)
+
+# %% ../nbs/01_minipy.ipynb #9be770ad
+class CPUTimeoutError(TimeoutError):
+    "Raised when code uses more CPU time than it's allowed"
+
+@contextmanager
+def _cpu_limit(limit):
+    "Raise `CPUTimeoutError` if this thread uses more than `limit` seconds of CPU time in the block"
+    if not limit:
+        yield
+        return
+    if not hasattr(time, 'pthread_getcpuclockid'):
+        raise NotImplementedError(f'cpu_limit needs time.pthread_getcpuclockid, which is not available on {sys.platform}')
+    tid = threading.get_ident()
+    clk = time.pthread_getcpuclockid(tid)
+    end,stop,lock,state = time.clock_gettime(clk)+limit,threading.Event(),Lock(),{}
+    def _watch():
+        while not stop.wait(min(limit/10, 0.05)):
+            if time.clock_gettime(clk)<end: continue
+            with lock:
+                if not state:
+                    state['fired'] = True
+                    _raise_in(tid, CPUTimeoutError)
+            return
+    threading.Thread(target=_watch, daemon=True).start()
+    try: yield
+    finally:
+        stop.set()
+        with lock: fired = state.setdefault('fired', False)
+        if fired: _raise_in(tid, None)
+
+def _vm_size()->int:
+    "Size of the address space of this process in bytes (only available on Linux, otherwise 0)"
+    try:
+        import resource
+        return int(Path('/proc/self/statm').read_text().split()[0])*resource.getpagesize()
+    except (ImportError, OSError): return 0
+
+_mem_lock,_mem_lims,_mem_orig = Lock(),[],None
+
+def _set_mem_rlimit():
+    "Set `RLIMIT_AS` to the tightest of the active limits, or back to the original limit once there are none"
+    import resource
+    soft,hard = _mem_orig
+    if _mem_lims: soft = min(_mem_lims) if soft==resource.RLIM_INFINITY else min(soft, *_mem_lims)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+@contextmanager
+def _mem_limit(max_bytes):
+    "Make allocations which grow the process address space by more than `max_bytes` in the block raise `MemoryError`"
+    if not max_bytes:
+        yield
+        return
+    try: import resource
+    except ImportError: raise NotImplementedError(f'mem_limit needs the resource module, which is not available on {sys.platform}') from None
+    global _mem_orig
+    with _mem_lock:
+        if not _mem_lims: _mem_orig = resource.getrlimit(resource.RLIMIT_AS)
+        lim = _vm_size()+max_bytes
+        if _mem_orig[1]!=resource.RLIM_INFINITY: lim = min(lim, _mem_orig[1])
+        _mem_lims.append(lim)
+        _set_mem_rlimit()
+    try: yield
+    finally:
+        with _mem_lock:
+            _mem_lims.remove(lim)
+            _set_mem_rlimit()
+
+# %% ../nbs/01_minipy.ipynb #9dc3f8c0
+ExecMetrics = namedtuple('ExecMetrics', 'wall cpu rss_delta stdout_bytes compile_time exec_time')
+
+def _peak_rss()->int:
+    "Peak resident set size of this process in bytes (0 where the `resource` module isn't available)"
+    try: import resource
+    except ImportError: return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform=='darwin' else rss*1024
+
+@contextmanager
+def _measure(stats:dict):
+    "Add the wall time, CPU time of this thread, and growth in peak RSS during the block to `stats`"
+    wall,cpu,rss = time.perf_counter(),time.thread_time(),_peak_rss()
+    try: yield stats
+    finally: stats.update(wall=time.perf_counter()-wall, cpu=time.thread_time()-cpu, rss_delta=_peak_rss()-rss)
+
+# %% ../nbs/01_minipy.ipynb #c1d8480c
 def minipy(
     code:str, # Code to execute
     glb:Optional[dict]=None, # Globals namespace
     loc:Optional[dict]=None, # Locals namespace
-    timeout:int=3600 # Maximum run time in seconds
+    timeout:int=3600, # Maximum run time in seconds
+    max_output:int=None, # Maximum number of chars of output to keep
+    cpu_limit:float=None, # Maximum CPU time in seconds
+    mem_limit:int=None, # Maximum growth of the process address space in bytes
+    metrics:bool=False # Return a tuple of the result and an `ExecMetrics`?
 ):
     "Executes python `code` with `timeout` and returning final expression (similar to IPython)."
-    def handler(*args): raise TimeoutError()
     if glb is None: glb = inspect.currentframe().f_back.f_globals
     if loc is None: loc=glb
-    signal.signal(signal.SIGALRM, handler)
-    signal.alarm(timeout)
-    try: return _run(code, glb, loc)
+    stats = dict(compile_time=0., exec_time=0., stdout_bytes=0)
+    try:
+        with _measure(stats), _time_limit(timeout), _cpu_limit(cpu_limit), _mem_limit(mem_limit):
+            res = _run(code, glb, loc, max_output=max_output, stats=stats)
+    except Exception as e: res = traceback.format_exc()
+    return (res, ExecMetrics(**stats)) if metrics else res
+
+# %% ../nbs/01_minipy.ipynb #65ca6c7f
+async def _arun(co, glb, loc, max_output=None):
+    "Run compiled code `co`, awaiting it if it has top-level `await`s"
+    glb.pop('_result', None)
+    with capture_output(max_output) as (out,err):
+        res = eval(co, glb, loc)
+        if inspect.iscoroutine(res): await res
+    return _output(glb, out, err)
+
+async def aminipy(
+    code:str, # Code to execute, which may use top-level `await`
+    glb:Optional[dict]=None, # Globals namespace; defaults to a new `__main__` namespace
+    loc:Optional[dict]=None, # Locals namespace
+    timeout:float=3600, # Maximum run time in seconds
+    max_output:int=None # Maximum number of chars of output to keep
+):
+    "Async `minipy`, which supports top-level `await` and doesn't block the event loop"
+    if glb is None: glb = {'__name__': '__main__'}
+    if loc is None: loc=glb
+    try:
+        co = _compile(code, flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+        if not co.co_flags & inspect.CO_COROUTINE:
+            # `minipy`'s own timeout can't interrupt blocking calls like `time.sleep`, so also stop waiting for the thread after `timeout`
+            return await asyncio.wait_for(asyncio.to_thread(minipy, code, glb, loc, timeout=timeout, max_output=max_output), timeout)
+        return await asyncio.wait_for(_arun(co, glb, loc, max_output), timeout)
     except Exception as e: return traceback.format_exc()
-    finally: signal.alarm(0)
+
+# %% ../nbs/01_minipy.ipynb #d5a83821
+def _worker(conn):
+    "Worker process loop for `MiniPyPool`: run each `(session, code, kwargs)` received on `conn`, sending back the result"
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    nss = {}
+    while True:
+        try: msg = conn.recv()
+        except EOFError: break
+        if msg is None: break
+        session,code,kw = msg
+        ns = nss.setdefault(session, {'__name__': '__main__'}) if session is not None else {'__name__': '__main__'}
+        res = minipy(code, ns, timeout=None, **kw)
+        try: conn.send(res)
+        except Exception: conn.send((repr(res[0]), res[1]) if kw.get('metrics') else repr(res))
+
+# %% ../nbs/01_minipy.ipynb #e224d8f2
+class MiniPyPool:
+    "Pool of worker processes running `minipy`-style code, with per-session namespaces and timeouts enforced by restarting the worker"
+    def __init__(self,
+                 n:int=None, # Number of worker processes (defaults to the number of CPUs)
+                 timeout:float=3600, # Default maximum run time in seconds
+                 start_method:str=None): # `multiprocessing` start method ('fork', 'spawn', ...)
+        self.n,self.timeout,self.ctx = n or defaults.cpus,timeout,mp.get_context(start_method)
+        self.locks,self.next,self.lock = [Lock() for _ in range(self.n)],0,Lock()
+        self.workers = [self._spawn() for _ in range(self.n)]
+        # Sessions with a namespace in each worker, and sessions whose namespace was lost in a restart but who haven't been told yet
+        self.sessions,self.lost = [set() for _ in range(self.n)],set()
+
+    def __repr__(self): return f'{type(self).__name__}(n={self.n}, timeout={self.timeout})'
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
+
+    def _spawn(self):
+        conn,child = self.ctx.Pipe()
+        p = self.ctx.Process(target=_worker, args=(child,), daemon=True)
+        p.start()
+        child.close()
+        return p,conn
+
+    def _restart(self, i):
+        "Kill worker `i` and start a new one in its place, marking the sessions it held as lost"
+        p,conn = self.workers[i]
+        p.kill()
+        p.join()
+        conn.close()
+        self.workers[i] = self._spawn()
+        self.lost |= self.sessions[i]
+        self.sessions[i] = set()
+
+    def _shard(self, session): return zlib.crc32(str(session).encode()) % self.n
+
+    def _acquire(self, session):
+        "Lock and return the index of the worker to run `session` on"
+        if session is not None: i = self._shard(session)
+        else:
+            with self.lock: i,self.next = self.next,(self.next+1)%self.n
+            for j in range(self.n):
+                if self.locks[(i+j)%self.n].acquire(blocking=False): return (i+j)%self.n
+        self.locks[i].acquire()
+        return i
+
+    def run(self,
+            code:str, # Code to execute
+            session=None, # Key of a persistent namespace to run in; `None` for a fresh one
+            timeout:float=None, # Maximum run time in seconds (defaults to `self.timeout`)
+            **kwargs): # Passed to `minipy` in the worker, e.g. `cpu_limit`, `mem_limit` or `metrics`
+        "Execute python `code` in a worker, returning the final expression (or output, or traceback) like `minipy`"
+        timeout = ifnone(timeout, self.timeout)
+        i = self._acquire(session)
+        try:
+            if session in self.lost:
+                self.lost.discard(session)
+                return f'SessionResetError: session {session!r} was lost when its worker was restarted; code not run'
+            p,conn = self.workers[i]
+            try:
+                conn.send((session, code, kwargs))
+                if session is not None: self.sessions[i].add(session)
+                if conn.poll(timeout): return conn.recv()
+                msg = f'TimeoutError: code took more than {timeout} seconds; worker restarted'
+            except (EOFError, OSError): msg = f'RuntimeError: worker exited with code {p.exitcode}; worker restarted'
+            self._restart(i)
+            self.lost.discard(session)
+            return msg
+        finally: self.locks[i].release()
+
+    def map(self, codes, session=None, timeout:float=None)->list:
+        "`run` each of `codes` concurrently across the workers"
+        with ThreadPoolExecutor(self.n) as ex: return list(ex.map(partial(self.run, session=session, timeout=timeout), codes))
+
+    def close(self):
+        "Stop all the workers"
+        for p,conn in self.workers:
+            try: conn.send(None)
+            except OSError: pass
+        for p,conn in self.workers:
+            p.join(1)
+            if p.is_alive(): p.kill()
+            conn.close()
+        self.workers = []
@@ -3,40 +3,63 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_shell.ipynb.
 
 # %% auto #0
-__all__ = ['get_shell']
+__all__ = ['MiniShell', 'get_shell', 'reset_shell', 'ShellPool']
 
 # %% ../nbs/02_shell.ipynb #1328ef69
-import ast, time, signal, traceback
+import ast, sys, time, signal, traceback, asyncio
+from contextlib import contextmanager
+from threading import Lock
 from fastcore.utils import *
+from .minipy import capture_output, ExecMetrics, _time_limit, _cpu_limit, _mem_limit, _measure
 
 # %% ../nbs/02_shell.ipynb #6bbf062d
 from IPython.terminal.interactiveshell import TerminalInteractiveShell
-from IPython.utils.capture import capture_output
+from IPython.core.interactiveshell import InteractiveShell, ExecutionResult, ExecutionInfo
+from IPython.core.compilerop import CachingCompiler
 
 # %% ../nbs/02_shell.ipynb #34099c2f
 TerminalInteractiveShell.orig_run = TerminalInteractiveShell.run_cell
 
+class _TimedCompiler(CachingCompiler):
+    "`CachingCompiler` which adds the time spent parsing and compiling to `elapsed`"
+    elapsed = 0.
+    def ast_parse(self, *args, **kwargs):
+        t = time.perf_counter()
+        try: return super().ast_parse(*args, **kwargs)
+        finally: self.elapsed += time.perf_counter()-t
+    def __call__(self, *args, **kwargs):
+        t = time.perf_counter()
+        try: return super().__call__(*args, **kwargs)
+        finally: self.elapsed += time.perf_counter()-t
+
+class MiniShell(InteractiveShell):
+    "An `InteractiveShell` without the terminal and prompt_toolkit setup of `TerminalInteractiveShell`"
+    orig_run = InteractiveShell.run_cell
+
 # %% ../nbs/02_shell.ipynb #d6aa8e7b
+def _timeout_result(cell, e):
+    "An `ExecutionResult` for `cell` that failed with `e`"
+    res = ExecutionResult(ExecutionInfo(cell, False, False, True, None))
+    res.error_in_exec = e
+    return res
+
 @patch
-def run_cell(self:TerminalInteractiveShell, cell, timeout=None):
-    "Wrapper for original `run_cell` which adds timeout and output capture"
-    if timeout:
-        def handler(*args): raise TimeoutError()
-        signal.signal(signal.SIGALRM, handler)
-        signal.alarm(timeout)
-    try:
-        with capture_output() as io: result = self.orig_run(cell)
-        result.stdout = io.stdout
-        return result
-    except TimeoutException as e:
-        result = self.ExecutionResult(error_before_exec=None, error_in_exec=e)
-    finally:
-        if timeout: signal.alarm(0)
+def run_cell(self:TerminalInteractiveShell|MiniShell, cell, timeout=None, cpu_limit=None, mem_limit=None, max_output=None):
+    "Wrapper for original `run_cell` which adds timeout, resource limits, output capture and metrics (see `minipy`)"
+    stats,c0 = {},getattr(self.compile, 'elapsed', 0.)
+    with capture_output(max_output) as (out,err), _measure(stats):
+        try:
+            with _time_limit(timeout), _cpu_limit(cpu_limit), _mem_limit(mem_limit): result = self.orig_run(cell)
+        except TimeoutError as e: result = _timeout_result(cell, e)
+    ct = getattr(self.compile, 'elapsed', 0.)-c0
+    result.stdout = out.getvalue()
+    result.metrics = ExecMetrics(**stats, stdout_bytes=out.nbytes, compile_time=ct, exec_time=stats['wall']-ct)
+    return result
 
 # %% ../nbs/02_shell.ipynb #cdadbb12
-def get_shell()->TerminalInteractiveShell:
-    "Get a `TerminalInteractiveShell` with minimal functionality"
-    sh = TerminalInteractiveShell()
+def get_shell(terminal:bool=True)->TerminalInteractiveShell|MiniShell:
+    "Get a `TerminalInteractiveShell` (or `MiniShell` if not `terminal`) with minimal functionality"
+    sh = (TerminalInteractiveShell if terminal else MiniShell)(compiler_class=_TimedCompiler)
     sh.logger.log_output = sh.history_manager.enabled = False
     dh = sh.displayhook
     dh.finish_displayhook = dh.write_output_prompt = dh.start_displayhook = lambda: None
@@ -44,4 +67,67 @@ def get_shell()->TerminalInteractiveShell:
     sh.logstart = sh.automagic = sh.autoindent = False
     sh.autocall = 0
     sh.system = lambda cmd: None
+    sh._ns0,sh._hidden0 = dict(sh.user_ns),dict(sh.user_ns_hidden)
+    return sh
+
+# %% ../nbs/02_shell.ipynb #00754c44
+@patch
+async def arun_cell(self:TerminalInteractiveShell|MiniShell, cell, timeout=None, max_output=None):
+    "Async `run_cell`, supporting top-level `await` in `cell` without blocking the event loop"
+    try: transformed,exc = self.transform_cell(cell),None
+    except Exception: transformed,exc = cell,sys.exc_info()
+    if not self.should_run_async(cell, transformed_cell=transformed, preprocessing_exc_tuple=exc):
+        try: return await asyncio.wait_for(asyncio.to_thread(self.run_cell, cell, timeout=timeout, max_output=max_output), timeout)
+        except asyncio.TimeoutError: return _timeout_result(cell, TimeoutError())
+    with capture_output(max_output) as (out,err):
+        coro = self.run_cell_async(cell, transformed_cell=transformed, preprocessing_exc_tuple=exc)
+        try: result = await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError: result = _timeout_result(cell, TimeoutError())
+    if timeout and isinstance(result.error_in_exec, asyncio.CancelledError): result.error_in_exec = TimeoutError()
+    result.stdout = out.getvalue()
+    return result
+
+# %% ../nbs/02_shell.ipynb #874b1dbf
+def reset_shell(sh:TerminalInteractiveShell|MiniShell):
+    "Quickly restore `sh` to the state it had when created by `get_shell`"
+    hm,dh = sh.history_manager,sh.displayhook
+    hm.output_hist.clear()
+    hm.input_hist_parsed[:] = hm.input_hist_raw[:] = ['']
+    dh._ = dh.__ = dh.___ = ''
+    sh.user_ns.clear()
+    sh.user_ns.update(sh._ns0)
+    sh.user_ns_hidden.clear()
+    sh.user_ns_hidden.update(sh._hidden0)
+    sh.execution_count = 1
+    sh.last_execution_succeeded,sh.last_execution_result = True,None
+    sh.clear_main_mod_cache()
     return sh
+
+# %% ../nbs/02_shell.ipynb #bdc581e4
+class ShellPool:
+    "A pool of `n` pre-initialized shells, which are reset when returned"
+    def __init__(self, n:int=4, terminal:bool=False):
+        self.n,self.terminal,self.lock = n,terminal,Lock()
+        self.idle = [get_shell(terminal) for _ in range(n)]
+
+    def acquire(self)->TerminalInteractiveShell|MiniShell:
+        "Get an idle shell, or a new one if none are available"
+        with self.lock:
+            if self.idle: return self.idle.pop()
+        return get_shell(self.terminal)
+
+    def release(self, sh):
+        "Reset `sh` and return it to the pool if there's room"
+        reset_shell(sh)
+        with self.lock:
+            if len(self.idle)<self.n: self.idle.append(sh)
+
+    @contextmanager
+    def shell(self):
+        "Context manager which acquires a shell and releases it at the end"
+        sh = self.acquire()
+        try: yield sh
+        finally: self.release(sh)
+
+    def __len__(self): return len(self.idle)
+    def __repr__(self): return f'{type(self).__name__}(idle={len(self)}, n={self.n})'
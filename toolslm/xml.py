@@ -3,22 +3,29 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_xml.ipynb.
 
 # %% auto #0
-__all__ = ['doctype', 'json_to_xml', 'get_mime_text', 'cell2out', 'cell2xml', 'cells2xml', 'nb2xml', 'mk_doctype', 'mk_doc',
-           'docs_xml', 'read_file', 'files2ctx', 'folder2ctx', 'sym2file', 'sym2folderctx', 'sym2pkgpath', 'sym2pkgctx',
-           'parse_gh_url', 'repo2ctx']
+__all__ = ['doctype', 'read_cache', 'repo_cache', 'json_to_xml', 'get_mime_text', 'cell2out', 'cell2xml', 'cells2xml', 'nb2xml',
+           'mk_doctype', 'mk_doc', 'docs_xml_iter', 'docs_xml', 'FileCache', 'read_file', 'files2ctx', 'approx_tokens',
+           'folder2ctx_iter', 'folder2ctx', 'FolderSnapshot', 'sym2file', 'sym2folderctx', 'sym2pkgpath', 'sym2pkgctx',
+           'parse_gh_url', 'tar2ctx_iter', 'tar2ctx', 'RepoCache', 'repo2ctx']
 
 # %% ../nbs/00_xml.ipynb #033c76fd
-import hashlib, inspect, xml.etree.ElementTree as ET, ast
-from collections import namedtuple
+import hashlib, inspect, json, argparse, xml.etree.ElementTree as ET, ast
+from collections import namedtuple, deque, OrderedDict
+from threading import Lock
+from html import escape
 from ghapi.all import GhApi
 
 from fastcore.utils import *
 from fastcore.meta import delegates
-from fastcore.xtras import hl_md
+from fastcore.xtras import hl_md, exttypes, compile_re
+from pathlib import PurePosixPath
+from types import SimpleNamespace
+from typing import Annotated
 from fastcore.xml import to_xml, Document, Documents, Document_content, Src, Source,Out,Outs,Cell,Notebook,Md,Code,Raw
 from fastcore.script import call_parse, is_cli
+from fastcore.xdg import xdg_cache_home
 
-from codesigs import file_sigs
+from codesigs import file_sigs, ext_sigs
 
 # %% ../nbs/00_xml.ipynb #2795f9fc
 def json_to_xml(
@@ -69,6 +76,60 @@ def cell2xml(cell, out=True, ids=True, nums=False):
     if out_items: parts.append(Outs(*out_items))
     return f(*parts, **kw)
 
+# %% ../nbs/00_xml.ipynb #ee23cd45
+_payload_re = re.compile(r'"(?:image|application)/[^"\\]*"\s*:\s*"')
+
+def _blank_payloads(txt):
+    "Replace string values of `image/*` and `application/*` entries in notebook JSON `txt` with empty strings"
+    parts,i = [],0
+    for m in _payload_re.finditer(txt):
+        if m.start()<i: continue
+        j = m.end()
+        while True:
+            j = txt.find('"', j)
+            k = j
+            while txt[k-1]=='\\': k -= 1
+            if (j-k)%2==0: break
+            j += 1
+        parts.append(txt[i:m.end()])
+        i = j
+    parts.append(txt[i:])
+    return ''.join(parts)
+
+def _xtag(tag, *cs, void=False, **kw):
+    "XML str for `tag` containing (unescaped) `cs`, rendered the same way as `to_xml`"
+    attrs = ''
+    for k,v in kw.items():
+        if v is None or v is False: continue
+        if v is True: attrs += f' {k}'; continue
+        v = str(v)
+        if '&' in v or '<' in v or '>' in v: v = escape(v, quote=False)
+        qt = "'" if '"' in v else '"'
+        if qt=="'": v = v.replace("'", "&#39;")
+        attrs += f' {k}={qt}{v}{qt}'
+    return f'<{tag}{attrs}>' + ''.join(cs) + ('' if void else f'</{tag}>')
+
+def _out_xml(o):
+    "Like `cell2out`, but for an output dict, returning an XML str"
+    data = o.get('data')
+    if data is not None and (txt:=get_mime_text(data)): return _xtag('out', txt, mime='markdown' if 'text/markdown' in data else 'plain')
+    if 'text' in o:
+        txt = o['text'] if isinstance(o['text'], str) else ''.join(o['text'])
+        return _xtag('out', txt, type='stream', name=o.get('name', 'stdout'))
+    if 'ename' in o: return _xtag('out', f"{o['ename']}: {o['evalue']}", type='error')
+
+_cttags = {'code': 'code', 'markdown': 'md', 'raw': 'raw'}
+
+def _cell_xml(cell, out=True, ids=True, nums=False):
+    "Like `cell2xml`, but for a cell dict, returning an XML str"
+    src = ''.join(cell.get('source', ''))
+    if nums: src = '\n'.join(f'{i+1:6d} │ {l}' for i,l in enumerate(src.splitlines()))
+    tag = _cttags[cell['cell_type']]
+    kw = dict(id=cell['id']) if ids and 'id' in cell else {}
+    if not out: return _xtag(tag, src, **kw)
+    outs = [o for o in map(_out_xml, cell.get('outputs', [])) if o]
+    return _xtag(tag, _xtag('source', src, void=True), _xtag('outs', *outs) if outs else '', **kw)
+
 # %% ../nbs/00_xml.ipynb #f780f576
 @delegates(cell2xml)
 def cells2xml(cells, wrap=Notebook, **kwargs):
@@ -80,8 +141,14 @@ def cells2xml(cells, wrap=Notebook, **kwargs):
 def nb2xml(fname=None, nb=None, **kwargs):
     "Convert notebook to XML format"
     assert bool(fname)^bool(nb), "Pass either `fname` or `nb`"
-    if not nb: nb = dict2obj(fname.read_json())
-    return cells2xml(nb.cells, **kwargs)
+    if nb: return cells2xml(nb.cells, **kwargs)
+    return _nbtxt2xml(Path(fname).read_text(), **kwargs)
+
+def _nbtxt2xml(txt, **kwargs):
+    "Convert notebook JSON `txt` to XML format"
+    if 'wrap' in kwargs: return cells2xml(dict2obj(loads(txt)).cells, **kwargs)
+    cells = loads(_blank_payloads(txt))['cells']
+    return _xtag('notebook', *(_cell_xml(c, **kwargs) for c in cells))
 
 # %% ../nbs/00_xml.ipynb #a01dc320
 doctype = namedtuple('doctype', ['src', 'content'])
@@ -116,6 +183,24 @@ def mk_doc(
     src = Src(NotStr(dt.src))
     return Document(src, content, index=index, **kwargs)
 
+# %% ../nbs/00_xml.ipynb #90c977b5
+def docs_xml_iter(
+    docs:Iterable[str],  # The content of each document
+    srcs:Optional[Iterable]=None,  # URLs, filenames, etc; each one defaults to `md5(content)` if not provided
+    prefix:bool=False, # Include Anthropic's suggested prose intro?
+    details:Optional[Iterable]=None, # Optional dicts with additional attrs for each doc
+    title:str=None # Optional title attr for Documents element
+):
+    "Yield the XML for `docs` in Anthropic's recommended format as chunks: the opening tag, each document, then the closing tag"
+    pre = 'Here are some documents for you to reference for your task:\n\n' if prefix else ''
+    kw = dict(title=title) if title else {}
+    yield pre + to_xml(Documents(**kw), do_escape=False)[:-len('</documents>')]
+    if srcs is None: srcs = itertools.repeat(None)
+    if details is None: details = itertools.repeat({})
+    for i,(d,s,kw) in enumerate(zip(docs,srcs,details)):
+        if d.strip(): yield to_xml(mk_doc(i+1, d, s, **kw), do_escape=False)
+    yield '</documents>'
+
 # %% ../nbs/00_xml.ipynb #32237f0a
 def docs_xml(
     docs:list[str],  # The content of each document
@@ -125,26 +210,131 @@ def docs_xml(
     title:str=None # Optional title attr for Documents element
 )->str:
     "Create an XML string containing `docs` in Anthropic's recommended format"
-    pre = 'Here are some documents for you to reference for your task:\n\n' if prefix else ''
-    if srcs is None: srcs = [None]*len(docs)
-    if details is None: details = [{}]*len(docs)
-    docs = (mk_doc(i+1, d, s, **kw) for i,(d,s,kw) in enumerate(zip(docs,srcs,details)) if d.strip())
-    kw = dict(title=title) if title else {}
-    return pre + to_xml(Documents(*docs, **kw), do_escape=False)
+    return ''.join(docs_xml_iter(docs, srcs, prefix=prefix, details=details, title=title))
+
+# %% ../nbs/00_xml.ipynb #9c017be6
+class FileCache:
+    "LRU cache of rendered file contents, keyed on path, size, mtime and render options; optionally persisted to `path`"
+    def __init__(self,
+                 max_bytes:int=50_000_000, # Evict least recently used entries once this size is exceeded (in memory and on disk)
+                 path:Union[str,Path]=None): # Folder to also store entries in, so they persist across sessions
+        self.max_bytes,self.path = max_bytes,Path(path).expanduser() if path else None
+        self.d,self.nbytes,self.hits,self.misses,self.lock = OrderedDict(),0,0,0,Lock()
+        if self.path:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self.disk_bytes = sum(o.stat().st_size for o in self.path.glob('*.txt'))
+
+    def __repr__(self): return f'{type(self).__name__}(hits={self.hits}, misses={self.misses}, n={len(self.d)}, nbytes={self.nbytes})'
+
+    def key(self, fname, **kwargs):
+        "Cache key for `fname` rendered with `kwargs`"
+        st = fname.stat()
+        return str(fname.absolute()), st.st_size, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, tuple(sorted(kwargs.items()))
+
+    def _fn(self, k): return self.path/(hashlib.md5(repr(k).encode()).hexdigest()+'.txt')
+
+    def get(self, k):
+        "Cached value for key `k`, or `None`"
+        with self.lock:
+            if k in self.d:
+                self.d.move_to_end(k)
+                return self.d[k]
+        if not self.path: return None
+        fn = self._fn(k)
+        try: res = fn.read_text(encoding='utf-8')
+        except FileNotFoundError: return None
+        os.utime(fn)
+        self._add(k, res)
+        return res
+
+    def _add(self, k, v):
+        with self.lock:
+            if k in self.d: return
+            self.d[k] = v
+            self.nbytes += len(v)
+            while self.nbytes>self.max_bytes and self.d: self.nbytes -= len(self.d.popitem(last=False)[1])
+
+    def set(self, k, v):
+        "Store `v` under key `k`"
+        self._add(k, v)
+        if not self.path: return
+        fn = self._fn(k)
+        with atomic_save(fn, 'w', encoding='utf-8') as f: f.write(v)
+        with self.lock:
+            self.disk_bytes += fn.stat().st_size
+            if self.disk_bytes>self.max_bytes: self._evict_disk()
+
+    def _evict_disk(self):
+        fns = sorted(self.path.glob('*.txt'), key=lambda o: o.stat().st_mtime_ns)
+        self.disk_bytes = sum(o.stat().st_size for o in fns)
+        for fn in fns:
+            if self.disk_bytes<=self.max_bytes: break
+            self.disk_bytes -= fn.stat().st_size
+            fn.unlink(missing_ok=True)
+
+    def __call__(self, f, fname, **kwargs):
+        "Return `f(fname, **kwargs)`, using the cached result if `fname` is unchanged"
+        k = self.key(fname, **kwargs)
+        res = self.get(k)
+        with self.lock:
+            if res is not None: self.hits += 1
+            else: self.misses += 1
+        if res is not None: return res
+        res = f(fname, **kwargs)
+        self.set(k, res)
+        return res
+
+    def clear(self):
+        "Remove all entries, including those on disk"
+        with self.lock:
+            self.d.clear()
+            self.nbytes = self.hits = self.misses = 0
+            if self.path:
+                for o in self.path.glob('*.txt'): o.unlink(missing_ok=True)
+                self.disk_bytes = 0
 
 # %% ../nbs/00_xml.ipynb #278b484b
+read_cache = FileCache(max_bytes=5_000_000)
+
+def _render_file(fname, sigs_only=False, **kwargs):
+    "Render `fname` as text, converting notebooks to XML if needed"
+    if fname.suffix == '.ipynb': return nb2xml(fname, **kwargs)
+    if sigs_only: return '\n'.join(str(s) for s in file_sigs(fname))
+    try: return fname.read_text()
+    except UnicodeDecodeError: return f"[Skipped: {fname.name} is binary]"
+
 @delegates(nb2xml)
 def read_file(fname, max_size=None, sigs_only=False, **kwargs):
     "Read file content, converting notebooks to XML if needed"
     fname = Path(fname).expanduser()
-    if fname.suffix == '.ipynb': res = nb2xml(fname, **kwargs)
-    elif sigs_only: res = '\n'.join(str(s) for s in file_sigs(fname))
-    else:
-        try: res = fname.read_text()
-        except UnicodeDecodeError: return f"[Skipped: {fname.name} is binary]"
+    if read_cache is None: res = _render_file(fname, sigs_only=sigs_only, **kwargs)
+    else: res = read_cache(_render_file, fname, sigs_only=sigs_only, **kwargs)
     if max_size and len(res)>max_size: return f"[Skipped: {fname.name} exceeds {max_size} bytes]"
     return res
 
+# %% ../nbs/00_xml.ipynb #38ea1e49
+def _read_ahead(fnames, n_workers, read=read_file, **kwargs):
+    "Yield `read` results for `fnames` in order, keeping up to `2*n_workers` reads in flight"
+    todo = iter(fnames)
+    with ThreadPoolExecutor(n_workers) as ex:
+        futs = deque(ex.submit(read, o, **kwargs) for o in itertools.islice(todo, n_workers*2))
+        try:
+            while futs:
+                yield futs.popleft().result()
+                if (o:=next(todo, None)) is not None: futs.append(ex.submit(read, o, **kwargs))
+        finally:
+            for f in futs: f.cancel()
+
+def _read_files(fnames, n_workers=None, max_total=None, read=read_file, **kwargs):
+    "Yield `read` (by default `read_file`) results for `fnames` in order using `n_workers` threads, stopping once more than `max_total` bytes are read"
+    if n_workers is None: n_workers = defaults.cpus
+    reads = _read_ahead(fnames, n_workers, read=read, **kwargs) if n_workers else (read(o, **kwargs) for o in fnames)
+    tot = 0
+    for s in reads:
+        yield s
+        tot += len(s)
+        if max_total and tot>max_total: return reads.close()
+
 # %% ../nbs/00_xml.ipynb #7d92255e
 @delegates(docs_xml)
 def files2ctx(
@@ -155,13 +345,101 @@ def files2ctx(
     ids:bool=True,  # Include cell ids in notebooks?
     nums:bool=False, # Include line numbers in notebook cell source?
     sigs_only:bool=False, # Only include signatures and docstrings (where supported by `codesigs` lib)
+    n_workers:int=None, # Number of threads used to read files (0 for serial); defaults to `defaults.cpus`
+    max_total:int=None, # Stop reading further files once this many bytes of content have been read
     **kwargs
 )->str: # XML for LM context
     "Convert files to XML context, handling notebooks"
     fnames = [Path(o).expanduser() for o in listify(fnames)]
-    contents = [read_file(o, max_size=max_size, out=out, ids=ids, sigs_only=sigs_only, nums=nums) for o in fnames]
+    contents = _read_files(fnames, n_workers=n_workers, max_total=max_total, max_size=max_size, out=out, ids=ids, sigs_only=sigs_only, nums=nums)
     return docs_xml(contents, srcs or fnames, **kwargs)
 
+# %% ../nbs/00_xml.ipynb #e62fabab
+def _trunc_iter(chunks, maxlen, suf, sizevar='_outsz_'):
+    "Yield `chunks`, truncated so that joining them matches `truncstr(''.join(chunks), maxlen, suf, sizevar=sizevar)`"
+    if not maxlen: yield from chunks; return
+    safe = maxlen - len(suf.format_map({sizevar: 10**30}))
+    done,n,tail = 0,0,''
+    for c in chunks:
+        if done==n and n+len(c)<=safe:
+            yield c
+            done += len(c)
+        elif n<maxlen: tail += c[:maxlen-n]
+        n += len(c)
+    if n<=maxlen:
+        if tail: yield tail
+    else:
+        suf = suf.format_map({sizevar: n})
+        yield tail[:maxlen-len(suf)-done] + suf
+
+# %% ../nbs/00_xml.ipynb #e4062c5a
+def approx_tokens(s:str)->int:
+    "Estimate the number of tokens in `s` as one per 4 characters"
+    return -(-len(s)//4)
+
+# %% ../nbs/00_xml.ipynb #ef5c7b23
+_order_keys = {'size': lambda f: f.stat().st_size, 'mtime': lambda f: -f.stat().st_mtime_ns}
+
+def _sort_fnames(fnames, readme_first=False, order=None):
+    "Sort `fnames` by `order` ('size', 'mtime' or None), optionally with READMEs first"
+    if order: fnames = sorted(fnames, key=_order_keys[order])
+    if readme_first: fnames = sorted(fnames, key=lambda f: (0 if 'readme' in f.name.lower() else 1, 0 if order else f))
+    return fnames
+
+# %% ../nbs/00_xml.ipynb #df77c028
+def _pack_iter(fnames, srcs, contents, max_tokens, tokenizer=None, prefix=False, title=None, max_size=None, sigs_only=False, max_shown=20, read=read_file):
+    "Yield XML for as many whole `contents` as fit in `max_tokens`, then a note listing those dropped"
+    tokenizer = tokenizer or approx_tokens
+    head = next(docs_xml_iter([], prefix=prefix, title=title))
+    used,i,dropped = tokenizer(head)+tokenizer('</documents>'),1,[]
+    yield head
+    for f,s,c in zip(fnames, srcs, contents):
+        if not c.strip(): continue
+        doc = to_xml(mk_doc(i, c, s), do_escape=False)
+        if used+tokenizer(doc)>max_tokens and not sigs_only and f.suffix!='.ipynb':
+            sigs = read(f, max_size=max_size, sigs_only=True)
+            if sigs.strip(): doc = to_xml(mk_doc(i, sigs, s, sigs_only='true'), do_escape=False)
+        if used+(n:=tokenizer(doc))>max_tokens:
+            dropped.append(str(s))
+            continue
+        used += n
+        i += 1
+        yield doc
+    yield '</documents>'
+    if not dropped: return
+    more = f' (and {len(dropped)-max_shown} more)' if len(dropped)>max_shown else ''
+    yield f"\n\n[OMITTED: {len(dropped)} files didn't fit in {max_tokens} tokens: {', '.join(dropped[:max_shown])}{more}]"
+
+# %% ../nbs/00_xml.ipynb #9be0cb09
+@delegates(globtastic, but='func')
+def folder2ctx_iter(
+    path:Union[str,Path]='.', # Folder to read
+    prefix:bool=False, # Include Anthropic's suggested prose intro?
+    out:bool=True, # Include notebook cell outputs?
+    include_base:bool=True, # Include full path in src?
+    title:str=None, # Optional title attr for Documents element
+    max_size:int=100_000, # Skip files larger than this (bytes)
+    max_total:int=10_000_000,  # Max total output size in bytes
+    readme_first:bool=False,  # Prioritize README files at start of context?
+    sigs_only:bool=False,  # Return signatures instead of full text? (where supported by `codesigs` lib)
+    ids:bool=True,  # Include cell ids in notebooks?
+    n_workers:int=None,  # Number of threads used to read files (0 for serial); defaults to `defaults.cpus`
+    max_tokens:int=None,  # Pack whole files into this many tokens, instead of truncating at `max_total` bytes
+    tokenizer:callable=None,  # Function returning the number of tokens in a str; defaults to `approx_tokens`
+    order:str=None,  # Sort files by 'size' (smallest first) or 'mtime' (newest first), after READMEs if `readme_first`
+    **kwargs
+):
+    "Yield XML context for folder contents in chunks: the opening `<documents>` tag, each `<document>`, then the closing tag"
+    folder = Path(path).expanduser()
+    fnames = _sort_fnames(pglob(folder, **kwargs), readme_first=readme_first, order=order)
+    srcs = fnames if include_base else [f.relative_to(folder) for f in fnames]
+    contents = _read_files(fnames, n_workers=n_workers, max_total=None if max_tokens else max_total, max_size=max_size, out=out, ids=ids, sigs_only=sigs_only)
+    if max_tokens:
+        yield from _pack_iter(fnames, srcs, contents, max_tokens, tokenizer, prefix=prefix, title=title, max_size=max_size, sigs_only=sigs_only)
+        return
+    suf = f"\n\n[TRUNCATED: output exceeded max size {max_total} bytes]"
+    yield from _trunc_iter(docs_xml_iter(contents, srcs, prefix=prefix, title=title), max_total, suf)
+
 # %% ../nbs/00_xml.ipynb #f97bc488
 @call_parse
 @delegates(globtastic, but='func')
@@ -177,21 +455,65 @@ def folder2ctx(
     files_only:bool=False,  # Return dict of {filename: size} instead of context?
     sigs_only:bool=False,  # Return signatures instead of full text? (where supported by `codesigs` lib)
     ids:bool=True,  # Include cell ids in notebooks?
+    n_workers:int=None,  # Number of threads used to read files (0 for serial); defaults to `defaults.cpus`
+    max_tokens:int=None,  # Pack whole files into this many tokens, instead of truncating at `max_total` bytes
+    order:str=None,  # Sort files by 'size' (smallest first) or 'mtime' (newest first), after READMEs if `readme_first`
     **kwargs
 )->Union[str,dict]:
     "Convert folder contents to XML context, handling notebooks; prints instead of returning when run as a CLI"
     folder = Path(path).expanduser()
-    fnames = pglob(folder, **kwargs)
-    if files_only: res = {str(f.relative_to(folder)): f.stat().st_size for f in fnames}
-    else:
-        if readme_first: fnames = sorted(fnames, key=lambda f: (0 if 'readme' in f.name.lower() else 1, f))
-        srcs = fnames if include_base else [f.relative_to(folder) for f in fnames]
-        res = files2ctx(fnames, prefix=prefix, out=out, srcs=srcs, title=title, max_size=max_size, sigs_only=sigs_only, ids=ids)
-        suf = f"\n\n[TRUNCATED: output size {{_outsz_}} exceeded max size {max_total} bytes]"
-        if max_total and len(res) > max_total: res = truncstr(res, max_total, suf=suf, sizevar='_outsz_')
+    if files_only: res = {str(f.relative_to(folder)): f.stat().st_size for f in pglob(folder, **kwargs)}
+    else: res = ''.join(folder2ctx_iter(folder, prefix=prefix, out=out, include_base=include_base, title=title, max_size=max_size,
+                                        max_total=max_total, readme_first=readme_first, sigs_only=sigs_only, ids=ids, n_workers=n_workers,
+                                        max_tokens=max_tokens, order=order, **kwargs))
     if is_cli(folder2ctx): print(res)
     else: return res
 
+# %% ../nbs/00_xml.ipynb #8fff7693
+class FolderSnapshot:
+    "Remember the files in a folder, so `update` can return context for just those changed since the last call"
+    def __init__(self,
+                 path:Union[str,Path]='.', # Folder to track
+                 include_base:bool=False, # Include full path in src?
+                 title:str=None, # Optional title attr for Documents element
+                 max_size:int=100_000, # Skip files larger than this (bytes)
+                 out:bool=True, # Include notebook cell outputs?
+                 ids:bool=True,  # Include cell ids in notebooks?
+                 sigs_only:bool=False,  # Return signatures instead of full text? (where supported by `codesigs` lib)
+                 n_workers:int=None,  # Number of threads used to read files (0 for serial); defaults to `defaults.cpus`
+                 **kwargs): # Passed to `pglob`
+        self.path,self.include_base,self.title,self.n_workers,self.kwargs = Path(path).expanduser(),include_base,title,n_workers,kwargs
+        self.read_kw = dict(max_size=max_size, out=out, ids=ids, sigs_only=sigs_only)
+        self.files = {} # {fname: (size, mtime_ns, md5)}
+
+    def __repr__(self): return f'{type(self).__name__}({self.path}, n_files={len(self.files)})'
+    def _src(self, f): return f if self.include_base else f.relative_to(self.path)
+
+    def update(self)->str:
+        "XML context for files added, modified or deleted since the last call (all files on the first call)"
+        stats = {f: f.stat() for f in pglob(self.path, **self.kwargs)}
+        todo = [f for f,st in stats.items() if self.files.get(f, ())[:2] != (st.st_size, st.st_mtime_ns)]
+        changed = {}
+        for f in todo:
+            # Hash the file itself rather than its rendered text, which is a fixed note for skipped files
+            h,old = hashlib.md5(f.read_bytes()).hexdigest(),self.files.get(f)
+            self.files[f] = (stats[f].st_size, stats[f].st_mtime_ns, h)
+            if not old or old[2]!=h: changed[f] = old
+        docs,srcs,details = [],[],[]
+        for (f,old),c in zip(changed.items(), _read_files(list(changed), n_workers=self.n_workers, **self.read_kw)):
+            if not c.strip():
+                if not old: continue
+                c = f'[Empty: {f.name}]'
+            docs.append(c)
+            srcs.append(self._src(f))
+            details.append(dict(change='modified' if old else 'added'))
+        for f in [f for f in self.files if f not in stats]:
+            del self.files[f]
+            docs.append(f'[Deleted: {f.name}]')
+            srcs.append(self._src(f))
+            details.append(dict(change='deleted'))
+        return docs_xml(docs, srcs, details=details, title=self.title)
+
 # %% ../nbs/00_xml.ipynb #9dc68935
 def sym2file(sym):
     "Return md string with filepath and contents for a symbol's source file"
@@ -234,7 +556,230 @@ def parse_gh_url(url):
     m = re.match(r'https?://(?:www\.)?github\.com/([^/]+)/([^/]+)(?:/([^/]+)(?:/([^/]+)(?:/(.+))?)?)?', url)
     return dict(zip('owner repo typ ref path'.split(), m.groups())) if m else None
 
+# %% ../nbs/00_xml.ipynb #644e8ba3
+def _path_filter(recursive=True, maxdepth=None, file_glob=None, file_re=None, path_glob=None, path_re=None, folder_re=None,
+                 skip_file_glob=None, skip_file_re=None, skip_folder_re=None, types=None, exts=None, symlinks=True, ret_folders=False):
+    "Predicate `keep(rel, base)` for '/'-separated paths `rel` under folder `base`, which makes the same decisions as `globtastic(base)`"
+    from fnmatch import fnmatch
+    # `globtastic` builds these `walk` callbacks inside itself, so they're set up the same way here
+    if not recursive: skip_folder_re='.'
+    exts = L(exts).flatmap(~Self.split(',')) + exttypes(types)
+    if exts: file_re = f"({'|'.join(re.escape(e if e.startswith('.') else f'.{e}') for e in exts)})$"
+    file_re,folder_re,path_re = compile_re(file_re),compile_re(folder_re),compile_re(path_re)
+    skip_file_re,skip_folder_re = compile_re(skip_file_re),compile_re(skip_folder_re)
+    def keep_file(root, name):
+        fname = os.path.join(root,name)
+        return ((not path_glob or fnmatch(fname, path_glob)) and (not path_re or path_re.search(fname)) and
+                (not file_glob or fnmatch(name, file_glob)) and (not file_re or file_re.search(name)) and
+                (not skip_file_glob or not fnmatch(name, skip_file_glob)) and (not skip_file_re or not skip_file_re.search(name)))
+    def keep_folder(root, name): return not folder_re or folder_re.search(os.path.join(root,name))
+    def skip_folder(root, name): return skip_folder_re and skip_folder_re.search(name)
+    def keep(rel, base=''):
+        "Whether `walk` would reach `rel` from `base` and keep it"
+        *folders,name = rel.split('/')
+        if maxdepth is not None and len(folders)>max(maxdepth-1, 0): return False
+        root = base
+        for d in folders:
+            if skip_folder(root, d) or not keep_folder(root, d): return False
+            root = os.path.join(root, d)
+        return keep_file(root, name)
+    return keep
+
+class _MemFile(namedtuple('_MemFile', 'path size mtime data')):
+    "A file read from an archive: its relative `path` (a `PurePosixPath`), size, `mtime` in ns, and contents (`None` if not read)"
+    name = property(lambda self: self.path.name)
+    suffix = property(lambda self: self.path.suffix)
+    def stat(self): return SimpleNamespace(st_size=self.size, st_mtime_ns=self.mtime)
+
+def _read_mem(f, max_size=None, sigs_only=False, **kwargs):
+    "Like `read_file`, for a `_MemFile`"
+    if f.data is None: return f"[Skipped: {f.name} exceeds {max_size} bytes]"
+    try: txt = f.data.decode().replace('\r\n', '\n').replace('\r', '\n')
+    except UnicodeDecodeError: res = '' if sigs_only and f.suffix!='.ipynb' else f"[Skipped: {f.name} is binary]"
+    else:
+        if f.suffix=='.ipynb': res = _nbtxt2xml(txt, **kwargs)
+        elif sigs_only: res = '\n'.join(str(s) for s in ext_sigs(txt, f.suffix))
+        else: res = txt
+    if max_size and len(res)>max_size: return f"[Skipped: {f.name} exceeds {max_size} bytes]"
+    return res
+
+# %% ../nbs/00_xml.ipynb #b9af07e2
+def _tar_files(src, folder=None, strip=0, max_size=None, read=True, sort=True, **kwargs)->list:
+    "`_MemFile`s for files in tarball `src` under `folder` passing the `globtastic` filters in `kwargs`, reading `src` as a stream"
+    import tarfile
+    keep,pre,res = _path_filter(**kwargs),(folder.strip('/')+'/' if folder else ''),[]
+    tf = tarfile.open(src, mode='r|*') if isinstance(src, (str,Path)) else tarfile.open(fileobj=src, mode='r|*')
+    with tf:
+        for m in tf:
+            if not m.isfile(): continue
+            name = re.sub(r'^(\./)+', '', m.name)
+            rel = '/'.join(name.split('/')[strip:])
+            if not rel.startswith(pre): continue
+            # Paths are matched including the folders above `folder`, like `globtastic` includes the path it's given
+            rel = rel[len(pre):]
+            if not keep(rel, name[:len(name)-len(rel)].rstrip('/')): continue
+            # Notebooks are checked against `max_size` after rendering, like `read_file` does, since their outputs may be dropped
+            big = max_size and m.size>max_size and not name.endswith('.ipynb')
+            data = tf.extractfile(m).read() if read and not big else None
+            res.append(_MemFile(PurePosixPath(rel), m.size, int(m.mtime*1e9), data))
+    return sorted(res, key=lambda f: f.path.parts) if sort else res
+
+@delegates(globtastic, but=['func','path'])
+def tar2ctx_iter(
+    src, # Path of the tarball, or a file object to read it from
+    folder:str=None, # Only include files under this path in the tarball
+    strip:int=0, # Number of leading folders to remove from member paths (like `tar --strip-components`)
+    prefix:bool=False, # Include Anthropic's suggested prose intro?
+    out:bool=True, # Include notebook cell outputs?
+    title:str=None, # Optional title attr for Documents element
+    max_size:int=100_000, # Skip files larger than this (bytes)
+    max_total:int=10_000_000,  # Max total output size in bytes
+    readme_first:bool=False,  # Prioritize README files at start of context?
+    sigs_only:bool=False,  # Return signatures instead of full text? (where supported by `codesigs` lib)
+    ids:bool=True,  # Include cell ids in notebooks?
+    n_workers:int=None,  # Number of threads used to render files (0 for serial); defaults to `defaults.cpus`
+    max_tokens:int=None,  # Pack whole files into this many tokens, instead of truncating at `max_total` bytes
+    tokenizer:callable=None,  # Function returning the number of tokens in a str; defaults to `approx_tokens`
+    order:str=None,  # Sort files by 'size' (smallest first) or 'mtime' (newest first), after READMEs if `readme_first`
+    **kwargs
+):
+    "Yield XML context for the files in a tarball in chunks, like `folder2ctx_iter`, without extracting it"
+    files = _sort_fnames(_tar_files(src, folder, strip, max_size, **kwargs), readme_first=readme_first, order=order)
+    srcs = [f.path for f in files]
+    contents = _read_files(files, n_workers=n_workers, max_total=None if max_tokens else max_total, read=_read_mem, max_size=max_size, out=out, ids=ids, sigs_only=sigs_only)
+    if max_tokens:
+        yield from _pack_iter(files, srcs, contents, max_tokens, tokenizer, prefix=prefix, title=title, max_size=max_size, sigs_only=sigs_only, read=_read_mem)
+        return
+    suf = f"\n\n[TRUNCATED: output exceeded max size {max_total} bytes]"
+    yield from _trunc_iter(docs_xml_iter(contents, srcs, prefix=prefix, title=title), max_total, suf)
+
+@delegates(tar2ctx_iter)
+def tar2ctx(
+    src, # Path of the tarball, or a file object to read it from
+    folder:str=None, # Only include files under this path in the tarball
+    strip:int=0, # Number of leading folders to remove from member paths (like `tar --strip-components`)
+    files_only:bool=False,  # Return dict of {filename: size} instead of context?
+    **kwargs
+)->Union[str,dict]:
+    "Convert the files in a tarball to XML context like `folder2ctx`, reading it as a stream without extracting it"
+    if not files_only: return ''.join(tar2ctx_iter(src, folder=folder, strip=strip, **kwargs))
+    kw = {k:v for k,v in kwargs.items() if k in inspect.signature(globtastic).parameters}
+    return {str(f.path): f.size for f in _tar_files(src, folder, strip, read=False, **kw)}
+
+# %% ../nbs/00_xml.ipynb #33f5fd3e
+_sha_re = re.compile(r'^[0-9a-f]{40}$')
+
+class RepoCache:
+    "Disk cache of GitHub repo tarballs, one per commit SHA, evicting the least recently used past `max_bytes`"
+    def __init__(self,
+                 path:Union[str,Path]=None, # Folder to store tarballs and resolved refs in (defaults to `toolslm/repos` in the XDG cache folder)
+                 max_bytes:int=1_000_000_000): # Evict least recently used tarballs once their total size exceeds this
+        self._path,self.max_bytes = path,max_bytes
+        self.hits,self.misses,self.lock = 0,0,Lock()
+
+    def __repr__(self): return f'{type(self).__name__}(path={str(self.path)!r}, hits={self.hits}, misses={self.misses}, n={len(self.files())})'
+
+    @property
+    def path(self)->Path:
+        "Folder of the cache, resolved on first use so that the default follows `XDG_CACHE_HOME` as set then, rather than at import"
+        if not isinstance(self._path, Path): self._path = Path(self._path or xdg_cache_home()/'toolslm'/'repos').expanduser()
+        return self._path
+
+    def _fn(self, owner, repo, sha): return self.path/owner.lower()/repo.lower()/f'{sha}.tar.gz'
+    def _key(self, owner, repo, ref=None): return f'{owner}/{repo}'.lower() + (f'@{ref}' if ref else '')
+
+    def _refs(self):
+        try: return json.loads((self.path/'refs.json').read_text())
+        except (FileNotFoundError, ValueError): return {}
+
+    def get_ref(self, owner, repo, ref=None)->tuple:
+        "`(ref, sha)` last resolved for `ref` (default branch if `None`) of `owner/repo`, or `None`"
+        refs = self._refs()
+        if ref is None: ref = refs.get(self._key(owner, repo))
+        if ref is None: return None
+        sha = ref.lower() if _sha_re.match(ref.lower()) else refs.get(self._key(owner, repo, ref))
+        return (ref, sha) if sha else None
+
+    def set_ref(self, owner, repo, ref, sha, default=False):
+        "Record that `ref` of `owner/repo` resolved to `sha`, and that it's the default branch if `default`"
+        with self.lock:
+            refs = self._refs()
+            refs[self._key(owner, repo, ref)] = sha
+            if default: refs[self._key(owner, repo)] = ref
+            with atomic_save(self.path/'refs.json', 'w') as f: f.write(json.dumps(refs, indent=1))
+
+    def get(self, owner, repo, sha)->bytes:
+        "Cached tarball for `sha` of `owner/repo`, or `None`"
+        fn = self._fn(owner, repo, sha)
+        try: res = fn.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(fn)
+        self.hits += 1
+        return res
+
+    def set(self, owner, repo, sha, data:bytes):
+        "Store tarball `data` for `sha` of `owner/repo`, then evict old tarballs if needed"
+        with atomic_save(self._fn(owner, repo, sha)) as f: f.write(data)
+        self._evict()
+
+    def files(self):
+        "Cached tarballs, least recently used first"
+        return sorted(self.path.glob('*/*/*.tar.gz'), key=lambda o: o.stat().st_mtime_ns)
+
+    @property
+    def nbytes(self): return sum(o.stat().st_size for o in self.files())
+
+    def _evict(self):
+        with self.lock:
+            fns = self.files()
+            total = sum(o.stat().st_size for o in fns)
+            for fn in fns[:-1]:
+                if total<=self.max_bytes: break
+                total -= fn.stat().st_size
+                fn.unlink(missing_ok=True)
+
+    def clear(self):
+        "Remove all cached tarballs and refs"
+        with self.lock:
+            for o in self.files(): o.unlink(missing_ok=True)
+            (self.path/'refs.json').unlink(missing_ok=True)
+            self.hits = self.misses = 0
+
+repo_cache = RepoCache()
+
+# %% ../nbs/00_xml.ipynb #f4880959
+async def _repo_tarball(api, owner, repo, ref=None, cache=None, offline=False):
+    "`(ref, data)` with the tarball bytes of `ref` (default branch if `None`) of `owner/repo`, using `cache` if given"
+    if offline:
+        if not cache: raise ValueError("`offline` needs a cache")
+        ref_sha = cache.get_ref(owner, repo, ref)
+        data = cache.get(owner, repo, ref_sha[1]) if ref_sha else None
+        if data is None: raise FileNotFoundError(f"{owner}/{repo}@{ref or 'default branch'} is not cached")
+        return ref_sha[0], data
+    default = ref is None
+    if default: ref = (await api.repos.get(owner, repo)).default_branch
+    if not cache: return ref, await api.repos.download_tarball_archive(owner, repo, ref)
+    sha = ref.lower() if _sha_re.match(ref.lower()) else (await api.repos.get_commit(owner, repo, ref)).sha
+    cache.set_ref(owner, repo, ref, sha, default=default)
+    data = cache.get(owner, repo, sha)
+    if data is None:
+        data = await api.repos.download_tarball_archive(owner, repo, sha)
+        cache.set(owner, repo, sha, data)
+    return ref, data
+
 # %% ../nbs/00_xml.ipynb #d91934db
+def _extract2ctx(data, folder=None, **kwargs):
+    "Extract the tarball bytes `data` to a temporary folder, and return `folder2ctx` for `folder` in it"
+    import tempfile, tarfile
+    tf = tarfile.open(fileobj=io.BytesIO(data))
+    with tempfile.TemporaryDirectory() as tmp:
+        tf.extractall(tmp, filter='data')
+        subdir = Path(tmp) / tf.getmembers()[0].name.split('/')[0]
+        if folder: subdir = subdir/folder
+        return folder2ctx(subdir, include_base=False, readme_first=True, **kwargs)
+
 @call_parse
 @delegates(folder2ctx, but=['path','include_base','title','readme_first'])
 async def repo2ctx(
@@ -244,10 +789,13 @@ async def repo2ctx(
     folder:str=None,  # Only include files under this path (get from URL not provided)
     show_filters:bool=True,  # Include filter info in title?
     token:str=None,  # GitHub token (uses GITHUB_TOKEN env var if None)
-    **kwargs  # Passed to `folder2ctx`
+    stream:bool=True,  # Read the tarball as a stream with `tar2ctx`, instead of extracting it to a temporary folder?
+    cache:bool=False,  # Store tarballs in `repo_cache` by commit SHA, and reuse them (or pass a `RepoCache`)?
+    offline:bool=False,  # Only use the cache (`repo_cache` unless `cache` is a `RepoCache`), without calling the GitHub API?
+    api:Annotated[GhApi, {'help': argparse.SUPPRESS}]=None,  # `GhApi` (or a stand-in with the same `repos` methods) to use instead of one made from `token`; not available from the CLI
+    **kwargs  # Passed to `tar2ctx` (or `folder2ctx` if not `stream`)
 )->Union[str,dict]: # XML for LM context, or dict of file sizes
     "Convert GitHub repo to XML context without cloning; prints instead of returning when run as a CLI"
-    import tempfile, tarfile, io
     if owner.startswith('http'):
         parsed = parse_gh_url(owner)
         if not parsed: raise ValueError(f"Invalid GitHub URL: {owner}")
@@ -255,19 +803,15 @@ async def repo2ctx(
         ref = ref or parsed.get('ref')
         folder = folder or parsed.get('path')
     if repo is None: owner, repo = owner.split('/')
-    api = GhApi(token=token)
-    if ref is None: ref = (await api.repos.get(owner, repo)).default_branch
-    data = await api.repos.download_tarball_archive(owner, repo, ref)
+    if cache is True or (offline and not cache): cache = repo_cache
+    if api is None and not offline: api = GhApi(token=token)
+    ref,data = await _repo_tarball(api, owner, repo, ref, cache=cache or None, offline=offline)
     title = f"GitHub repository contents from {owner}/{repo}/{ref}"
     if folder: title += f'/{folder}'
     if show_filters:
         parts = [f"{k}: {', '.join(v) if isinstance(v, (list,tuple)) else v}" for k,v in kwargs.items() if v]
         if parts: title += f" (filters applied -- {' | '.join(parts)})"
-    tf = tarfile.open(fileobj=io.BytesIO(data))
-    with tempfile.TemporaryDirectory() as tmp:
-        tf.extractall(tmp, filter='data')
-        subdir = Path(tmp) / tf.getmembers()[0].name.split('/')[0]
-        if folder: subdir = subdir/folder
-        res = folder2ctx(subdir, include_base=False, title=title, readme_first=True, **kwargs)
+    if stream: res = tar2ctx(io.BytesIO(data), folder=folder, strip=1, title=title, readme_first=True, **kwargs)
+    else: res = _extract2ctx(data, folder, title=title, **kwargs)
     if is_cli(repo2ctx): print(res)
     else: return res